@@ -15,6 +15,7 @@ from plone.pgcatalog.query import _bool_to_lower_str
 from psycopg import sql as pgsql
 
 import abc
+import functools
 import logging
 
 
@@ -118,6 +119,33 @@ def _build_tokenizer_toml(lang_code=None):
     return "\n".join(lines) + "\n"
 
 
+@functools.lru_cache(maxsize=8)
+def _bm25_names(tokenizer_prefix):
+    """Validated ``(column, index, tokenizer)`` names per language.
+
+    Keyed by language code, with ``None`` for the fallback column.  Every
+    name is checked with ``validate_identifier()`` once per tokenizer
+    prefix, so ``BM25Backend`` construction is just a cache lookup.
+    """
+    names = {
+        lang: (
+            f"search_bm25_{lang}",
+            f"idx_os_search_bm25_{lang}",
+            f"{tokenizer_prefix}_{lang}",
+        )
+        for lang in LANG_TOKENIZER_MAP
+    }
+    names[None] = ("search_bm25", "idx_os_search_bm25", f"{tokenizer_prefix}_default")
+    for triple in names.values():
+        for name in triple:
+            validate_identifier(name)
+    return names
+
+
+# Warm the cache for the default prefix at import time.
+_bm25_names("pgcatalog")
+
+
 def _normalize_lang(lang):
     """Normalize a language code: 'pt-br' → 'pt', 'zh-CN' → 'zh'."""
     if not lang:
@@ -180,6 +208,10 @@ class SearchBackend(abc.ABC):
         """Column: None pairs for uncatalog. Default: empty."""
         return {}
 
+    def uncatalog_columns(self):
+        """Names of the columns cleared by ``uncatalog_extra()``, as a tuple."""
+        return tuple(self.uncatalog_extra())
+
     def install_schema(self, conn):
         """Execute schema DDL statement-by-statement.
 
@@ -288,34 +320,29 @@ class BM25Backend(SearchBackend):
                     f"must be one of {sorted(LANG_TOKENIZER_MAP.keys())}"
                 )
 
-        # Secondary validation: ensure all generated identifiers are safe
-        # SQL identifiers (letters, digits, underscores only).
-        for lang in self.languages:
-            validate_identifier(self._col_name(lang))
-            validate_identifier(self._idx_name(lang))
-            validate_identifier(self._tok_name(lang))
-        # Validate fallback identifiers too
-        validate_identifier(self._col_name())
-        validate_identifier(self._idx_name())
-        validate_identifier(self._tok_name())
+        # Secondary validation: all generated identifiers are checked to be
+        # safe SQL identifiers (letters, digits, underscores only) once per
+        # tokenizer prefix by _bm25_names().
+        self._names = _bm25_names(tokenizer_prefix)
+        # Composed DDL for install_schema(), built on first use.
+        self._install_sql = None
+        # Backend columns NULLed on uncatalog: fallback first, then per-language.
+        self._extra_columns = (
+            "search_bm25",
+            *(self._col_name(lang) for lang in self.languages),
+        )
 
     def _tok_name(self, lang=None):
         """Tokenizer name for a language (or fallback)."""
-        if lang:
-            return f"{self.tokenizer_prefix}_{lang}"
-        return f"{self.tokenizer_prefix}_default"
+        return self._names[lang or None][2]
 
     def _col_name(self, lang=None):
         """Column name for a language (or fallback)."""
-        if lang:
-            return f"search_bm25_{lang}"
-        return "search_bm25"
+        return self._names[lang or None][0]
 
     def _idx_name(self, lang=None):
         """Index name for a language (or fallback)."""
-        if lang:
-            return f"idx_os_search_bm25_{lang}"
-        return "idx_os_search_bm25"
+        return self._names[lang or None][1]
 
     def get_extra_columns(self):
         from zodb_pgjsonb import ExtraColumn
@@ -400,12 +427,30 @@ class BM25Backend(SearchBackend):
 
         CREATE EXTENSION + DO $$ blocks require per-statement execution;
         multi-statement strings fail silently in transactional connections.
+        The statements are composed once per backend (see
+        ``_install_statements()``), so repeated installs only execute them.
+        """
+        for stmt in self._install_statements():
+            conn.execute(stmt)
+
+    def _install_statements(self):
+        """DDL statements for ``install_schema()``, composed on first use.
 
         Uses psycopg.sql for proper identifier quoting in DDL statements.
         Tokenizer names use sql.Literal() since they are function arguments.
         """
-        conn.execute("CREATE EXTENSION IF NOT EXISTS pg_tokenizer CASCADE")
-        conn.execute("CREATE EXTENSION IF NOT EXISTS vchord_bm25 CASCADE")
+        if self._install_sql is not None:
+            return self._install_sql
+
+        create_tokenizer = pgsql.SQL(
+            "DO $$ BEGIN "
+            "PERFORM create_tokenizer({tok}, $cfg$\n{toml}$cfg$);\n"
+            "EXCEPTION WHEN OTHERS THEN NULL; END $$"
+        )
+        stmts = [
+            "CREATE EXTENSION IF NOT EXISTS pg_tokenizer CASCADE",
+            "CREATE EXTENSION IF NOT EXISTS vchord_bm25 CASCADE",
+        ]
 
         # Per-language columns + tokenizers + indexes
         for lang in self.languages:
@@ -414,19 +459,15 @@ class BM25Backend(SearchBackend):
             idx = self._idx_name(lang)
             toml = _build_tokenizer_toml(lang)
 
-            conn.execute(
+            stmts.append(
                 pgsql.SQL(
                     "ALTER TABLE object_state ADD COLUMN IF NOT EXISTS {} bm25vector"
                 ).format(pgsql.Identifier(col))
             )
-            conn.execute(
-                pgsql.SQL(
-                    "DO $$ BEGIN "
-                    "PERFORM create_tokenizer({tok}, $cfg$\n{toml}$cfg$);\n"
-                    "EXCEPTION WHEN OTHERS THEN NULL; END $$"
-                ).format(tok=pgsql.Literal(tok), toml=pgsql.SQL(toml))
+            stmts.append(
+                create_tokenizer.format(tok=pgsql.Literal(tok), toml=pgsql.SQL(toml))
             )
-            conn.execute(
+            stmts.append(
                 pgsql.SQL(
                     "CREATE INDEX IF NOT EXISTS {} "
                     "ON object_state USING bm25 ({} bm25_ops)"
@@ -434,25 +475,23 @@ class BM25Backend(SearchBackend):
             )
 
         # Fallback column + tokenizer + index
-        fallback_toml = _build_tokenizer_toml(None)
-        conn.execute(
+        stmts.append(
             "ALTER TABLE object_state ADD COLUMN IF NOT EXISTS search_bm25 bm25vector"
         )
-        conn.execute(
-            pgsql.SQL(
-                "DO $$ BEGIN "
-                "PERFORM create_tokenizer({tok}, $cfg$\n{toml}$cfg$);\n"
-                "EXCEPTION WHEN OTHERS THEN NULL; END $$"
-            ).format(
+        stmts.append(
+            create_tokenizer.format(
                 tok=pgsql.Literal(self._tok_name()),
-                toml=pgsql.SQL(fallback_toml),
+                toml=pgsql.SQL(_build_tokenizer_toml(None)),
             )
         )
-        conn.execute(
+        stmts.append(
             "CREATE INDEX IF NOT EXISTS idx_os_search_bm25 "
             "ON object_state USING bm25 (search_bm25 bm25_ops)"
         )
 
+        self._install_sql = tuple(stmts)
+        return self._install_sql
+
     def get_extraction_update_sql(self):
         """PL/pgSQL function to merge Tika-extracted text into tsvector + BM25."""
         # Build per-language column updates
@@ -563,10 +602,10 @@ $$ LANGUAGE plpgsql;
         return True
 
     def uncatalog_extra(self):
-        result = {"search_bm25": None}
-        for lang in self.languages:
-            result[self._col_name(lang)] = None
-        return result
+        return dict.fromkeys(self._extra_columns)
+
+    def uncatalog_columns(self):
+        return self._extra_columns
 
     @classmethod
     def detect(cls, dsn):
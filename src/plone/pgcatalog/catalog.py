@@ -1419,8 +1419,12 @@ class PlonePGCatalogTool(UniqueObject, Folder):
         zoid = int(zoid)
         conn = self._get_pg_read_connection()
         with conn.cursor() as cur:
+            # PG unpacks and key-sorts idx (COLLATE "C": code point order)
             cur.execute(
-                "SELECT path, idx, "
+                "SELECT path, "
+                "COALESCE((SELECT jsonb_agg(jsonb_build_object('key', k, 'value', v) "
+                '  ORDER BY k COLLATE "C") FROM jsonb_each(idx) AS t(k, v)), '
+                "  '[]'::jsonb) AS idx_items, "
                 "searchable_text IS NOT NULL AS has_searchable_text, "
                 "left(searchable_text::text, 200) AS searchable_text_preview "
                 "FROM object_state WHERE zoid = %(zoid)s",
@@ -1429,10 +1433,10 @@ class PlonePGCatalogTool(UniqueObject, Folder):
             row = cur.fetchone()
         if row is None:
             return None
-        idx = row["idx"] or {}
         idx_items = []
-        for k in sorted(idx):
-            v = idx[k]
+        for item in row["idx_items"]:
+            k = item["key"]
+            v = item["value"]
             if isinstance(v, list):
                 display = ", ".join(str(i) for i in v)
             elif v is None:
@@ -18,6 +18,7 @@ from enum import Enum
 import dataclasses
 import logging
 import re
+import sys
 
 
 __all__ = [
@@ -41,7 +42,7 @@ log = logging.getLogger(__name__)
 
 # Safe SQL identifier pattern: letters, digits, underscores only.
 # Prevents SQL injection when idx_key values are interpolated into queries.
-_SAFE_IDENTIFIER_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+_SAFE_IDENTIFIER_RE = re.compile(r"[a-zA-Z_][a-zA-Z0-9_]*")
 
 
 def validate_identifier(name):
@@ -50,7 +51,7 @@ def validate_identifier(name):
     Raises ValueError if the name contains characters that could
     enable SQL injection when interpolated into query strings.
     """
-    if not _SAFE_IDENTIFIER_RE.match(name):
+    if not _SAFE_IDENTIFIER_RE.fullmatch(name):
         raise ValueError(
             f"Invalid identifier {name!r}: must match [a-zA-Z_][a-zA-Z0-9_]*"
         )
@@ -111,6 +112,8 @@ class IndexRegistry:
       ``getattr(wrapper, attr)``, from ``getIndexSourceNames()``.
     """
 
+    __slots__ = ("_indexes", "_metadata")
+
     def __init__(self):
         self._indexes = {}
         self._metadata = set()
@@ -126,51 +129,59 @@ class IndexRegistry:
         except AttributeError:
             return
 
+        # Local bindings: this loop runs once per catalog index.
+        entries = self._indexes
+        meta_type_get = META_TYPE_MAP.get
+        special = SPECIAL_INDEXES
+        validate = validate_identifier
+        intern = sys.intern
+
         for name, index_obj in zcatalog_indexes.items():
-            if name in self._indexes:
+            if name in entries:
                 continue  # already registered
 
             meta_type = getattr(index_obj, "meta_type", None)
             if meta_type is None:
                 continue
 
-            idx_type = META_TYPE_MAP.get(meta_type)
+            idx_type = meta_type_get(meta_type)
             if idx_type is None:
                 log.debug(
                     "Unknown index meta_type %r for %r — skipping", meta_type, name
                 )
                 continue
 
+            is_special = name in special
+
             # Validate index name as safe SQL identifier
-            if name not in SPECIAL_INDEXES:
+            if not is_special:
                 try:
-                    validate_identifier(name)
+                    validate(name)
                 except ValueError:
                     log.warning(
                         "Skipping index %r: name is not a safe SQL identifier", name
                     )
                     continue
 
-            # Read source attributes from index object
+            # Read source attributes from index object.  Names are interned:
+            # they are looked up via getattr() for every indexed object.
             source_attrs = None
             if hasattr(index_obj, "getIndexSourceNames"):
                 try:
-                    source_attrs = list(index_obj.getIndexSourceNames())
+                    source_attrs = [
+                        intern(attr) for attr in index_obj.getIndexSourceNames()
+                    ]
                 except Exception:
                     pass
             if not source_attrs:
                 source_attrs = [name]
 
             # Special indexes get idx_key=None
-            idx_key = None if name in SPECIAL_INDEXES else name
-
-            self._indexes[name] = (idx_type, idx_key, source_attrs)
+            entries[name] = (idx_type, None if is_special else name, source_attrs)
 
         # Metadata columns from catalog schema
         try:
-            schema = catalog._catalog.schema
-            for col_name in schema:
-                self._metadata.add(col_name)
+            self._metadata.update(catalog._catalog.schema)
         except AttributeError:
             pass
 
@@ -19,6 +19,7 @@ from plone.pgcatalog.columns import validate_identifier
 from plone.pgcatalog.interfaces import IPGIndexTranslator
 from zope.interface import implementer
 
+import functools
 import logging
 import re
 
@@ -38,6 +39,17 @@ _MAX_RRULE_LENGTH = 1000
 log = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=256)
+def _validated_index_name(index_name):
+    """Return *index_name* after ``validate_identifier()``, memoized.
+
+    A catalog has a small, fixed set of index names, so repeated queries
+    hit the cache.  Invalid names raise and are therefore never cached.
+    """
+    validate_identifier(index_name)
+    return index_name
+
+
 def _safe_getattr(obj, name):
     """Get attribute value, calling it if callable."""
     if not name:
@@ -104,7 +116,7 @@ class DateRecurringIndexTranslator:
         # architecture (ZCatalog registered name) and goes through
         # IndexRegistry validation at startup.  Belt-and-suspenders
         # check to prevent SQL injection via JSONB path expressions.
-        validate_identifier(index_name)
+        _validated_index_name(index_name)
 
         query_val = spec.get("query")
         range_spec = spec.get("range")
@@ -106,7 +106,7 @@ def uncatalog_object(conn, zoid):
     """
     from plone.pgcatalog.backends import get_backend
 
-    extra_nulls = get_backend().uncatalog_extra()
+    extra_nulls = get_backend().uncatalog_columns()
     extra_sql = "".join(f",\n            {col} = NULL" for col in extra_nulls)
 
     # Also NULL all extra idx columns
@@ -16,6 +16,7 @@ from plone.pgcatalog.pgindex import _maybe_wrap_index
 from psycopg import sql as pgsql
 from zope.component.hooks import getSite
 
+import functools
 import logging
 
 
@@ -58,15 +59,16 @@ def reindex_index(conn, name, batch_size=_REINDEX_BATCH_SIZE):
     return count
 
 
-def clear_catalog_data(conn):
-    """Clear all catalog data (path, idx, searchable_text, and backend extras).
+@functools.lru_cache(maxsize=4)
+def _clear_catalog_sql(extra_cols):
+    """Composed UPDATE clearing catalog data plus the given extra columns.
 
-    The base object_state rows are preserved.
+    Cached per tuple of backend extra columns — the backend is chosen
+    once at startup, so this is built once per process.
     """
-    extra_nulls = get_backend().uncatalog_extra()
     # Use psycopg.sql.Identifier for safe column name quoting
     extra_parts = [
-        pgsql.SQL(", {} = NULL").format(pgsql.Identifier(col)) for col in extra_nulls
+        pgsql.SQL(", {} = NULL").format(pgsql.Identifier(col)) for col in extra_cols
     ]
     extra_sql = pgsql.SQL("").join(extra_parts)
 
@@ -75,10 +77,18 @@ def clear_catalog_data(conn):
         "path = NULL, parent_path = NULL, path_depth = NULL, "
         "idx = NULL, searchable_text = NULL"
     )
-    query = pgsql.SQL("{base}{extra} WHERE idx IS NOT NULL").format(
+    return pgsql.SQL("{base}{extra} WHERE idx IS NOT NULL").format(
         base=base_sql, extra=extra_sql
     )
 
+
+def clear_catalog_data(conn):
+    """Clear all catalog data (path, idx, searchable_text, and backend extras).
+
+    The base object_state rows are preserved.
+    """
+    query = _clear_catalog_sql(get_backend().uncatalog_columns())
+
     with conn.cursor() as cur:
         cur.execute(query)
         count = cur.rowcount
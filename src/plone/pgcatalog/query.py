@@ -16,8 +16,10 @@ from plone.pgcatalog.columns import validate_identifier
 from psycopg.types.json import Json
 from typing import ClassVar
 
+import functools
 import logging
 import re
+import time
 
 
 log = logging.getLogger(__name__)
@@ -150,6 +152,38 @@ def build_query(query_dict):
     return builder.result()
 
 
+@functools.lru_cache(maxsize=256)
+def _roles_query(roles_key):
+    """Return the sorted role tuple for an ``allowedRolesAndUsers`` filter.
+
+    Keyed on the frozenset of roles: the same few principal sets recur
+    across requests, so the normalization is done once per set.  Sorting
+    also gives a stable parameter value for identical role sets.
+    """
+    return tuple(sorted(roles_key))
+
+
+# (second, datetime) of the last _now_utc() call; replaced as a whole.
+_NOW_CACHE = [(None, None)]
+
+
+def _now_utc():
+    """Current UTC time truncated to the second.
+
+    All secured queries within the same second bind the identical
+    effectiveRange value, which keeps the query cache key stable and
+    avoids building a new datetime per call.
+    """
+    from datetime import datetime
+
+    second = int(time.time())
+    cached_second, now = _NOW_CACHE[0]
+    if cached_second != second:
+        now = datetime.fromtimestamp(second, UTC)
+        _NOW_CACHE[0] = (second, now)
+    return now
+
+
 def apply_security_filters(query_dict, roles, show_inactive=False):
     """Inject security and effectiveRange filters into a query dict.
 
@@ -164,32 +198,40 @@ def apply_security_filters(query_dict, roles, show_inactive=False):
     Returns:
         new query dict with security filters added
     """
-    from datetime import datetime
-
-    result = dict(query_dict)
+    # Only the injected keys are built here; the caller's query is merged
+    # in one step below instead of being copied and then patched.
+    overlay = {}
 
     # Inject allowedRolesAndUsers (always, unless already present)
-    if "allowedRolesAndUsers" not in result:
-        result["allowedRolesAndUsers"] = {
-            "query": list(roles),
+    if "allowedRolesAndUsers" not in query_dict:
+        overlay["allowedRolesAndUsers"] = {
+            "query": list(_roles_query(frozenset(roles))),
             "operator": "or",
         }
 
-    # Inject effectiveRange (unless show_inactive or already present)
-    if (
-        not show_inactive
-        and "effectiveRange" not in result
-        and not result.get("show_inactive")
-    ):
-        result["effectiveRange"] = datetime.now(UTC)
+    # Inject effectiveRange (unless show_inactive or already present).
+    # The show_inactive meta-key is looked up once and only read when set.
+    has_inactive = "show_inactive" in query_dict
+    skip_range = show_inactive or (has_inactive and query_dict["show_inactive"])
+    if not skip_range and "effectiveRange" not in query_dict:
+        overlay["effectiveRange"] = _now_utc()
 
-    # Remove show_inactive from the dict (it's a meta-key, not an index)
-    result.pop("show_inactive", None)
+    if not has_inactive:
+        return {**query_dict, **overlay}
 
+    # Remove show_inactive from the dict (it's a meta-key, not an index)
+    result = {k: v for k, v in query_dict.items() if k != "show_inactive"}
+    result.update(overlay)
     return result
 
 
-def _execute_query(conn, query_dict, columns="zoid, path, idx, state"):
+def _execute_query(
+    conn,
+    query_dict,
+    columns="zoid, path, idx, state",
+    *,
+    row_factory=None,
+):
     """Execute a catalog query and return result rows.
 
     Internal convenience function for testing.  The ``columns`` parameter
@@ -199,9 +241,11 @@ def _execute_query(conn, query_dict, columns="zoid, path, idx, state"):
         conn: psycopg connection (with dict_row factory)
         query_dict: ZCatalog-style query dict
         columns: SQL column list to SELECT (must be a trusted constant)
+        row_factory: optional psycopg row factory overriding the
+            connection's, e.g. ``scalar_row`` for a single column
 
     Returns:
-        list of row dicts
+        list of rows (row dicts unless ``row_factory`` is given)
     """
     qr = build_query(query_dict)
     sql = f"SELECT {columns} FROM object_state WHERE {qr['where']}"
@@ -212,8 +256,11 @@ def _execute_query(conn, query_dict, columns="zoid, path, idx, state"):
     if qr["offset"]:
         sql += f" OFFSET {qr['offset']}"
 
-    with conn.cursor() as cur:
-        cur.execute(sql, qr["params"])
+    # The SQL text depends only on the query shape (keys, operators,
+    # limits) — values are bound parameters — so psycopg's prepared
+    # statement cache lets PG plan each shape once per connection.
+    with conn.cursor(row_factory=row_factory) as cur:
+        cur.execute(sql, qr["params"], prepare=True)
         return cur.fetchall()
 
 
@@ -524,12 +571,18 @@ class _QueryBuilder:
         query_val = spec.get("query")
         if query_val is None:
             return
-        val = _ensure_date_param(query_val)
+        self._effective_range(_ensure_date_param(query_val))
+
+    def _effective_range(self, val):
+        """effective <= val AND (expires IS NULL OR expires >= val)."""
         p = self._pname("effrange")
+        # Two plain conjuncts on the expression-indexed dates (no range
+        # type / compound expression), so each side stays sargable.  The
+        # NULL test comes first: most content never expires.
         self.clauses.append(
             f"(pgcatalog_to_timestamptz(idx->>'effective') <= %({p})s"
-            f" AND (pgcatalog_to_timestamptz(idx->>'expires') >= %({p})s"
-            f" OR idx->>'expires' IS NULL))"
+            f" AND (idx->>'expires' IS NULL"
+            f" OR pgcatalog_to_timestamptz(idx->>'expires') >= %({p})s))"
         )
         self.params[p] = val
 
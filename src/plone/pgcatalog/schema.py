@@ -128,6 +128,11 @@ CREATE INDEX IF NOT EXISTS idx_os_cat_effective
 CREATE INDEX IF NOT EXISTS idx_os_cat_expires
     ON object_state (pgcatalog_to_timestamptz(idx->>'expires')) WHERE idx IS NOT NULL;
 
+-- effective/expires stay timestamptz expression indexes rather than
+-- generated epoch columns: timestamptz and bigint are both 8-byte btree
+-- keys (same density), and adding a STORED generated column would rewrite
+-- all of object_state on upgrade.
+
 -- Expression indexes for common sort/filter fields
 CREATE INDEX IF NOT EXISTS idx_os_cat_sortable_title
     ON object_state ((idx->>'sortable_title')) WHERE idx IS NOT NULL;
@@ -328,6 +333,7 @@ EXPECTED_INDEXES = [
     "idx_os_searchable_text",
     "idx_os_cat_title_tsv",
     "idx_os_cat_description_tsv",
+    "idx_os_allowed_roles",
     "idx_os_object_provides",
 ]
 
@@ -380,11 +386,16 @@ CREATE TABLE IF NOT EXISTS text_extraction_queue (
     attempts     INTEGER NOT NULL DEFAULT 0,
     max_attempts INTEGER NOT NULL DEFAULT 3,
     error        TEXT,
+    next_attempt_at TIMESTAMPTZ,
     created_at   TIMESTAMPTZ NOT NULL DEFAULT now(),
     updated_at   TIMESTAMPTZ NOT NULL DEFAULT now(),
     UNIQUE(blob_zoid, tid)
 );
 
+-- Retry backoff: a failed job is not dequeued again before this time
+ALTER TABLE text_extraction_queue
+    ADD COLUMN IF NOT EXISTS next_attempt_at TIMESTAMPTZ;
+
 ALTER TABLE text_extraction_queue ADD COLUMN IF NOT EXISTS blob_zoid BIGINT;
 UPDATE text_extraction_queue SET blob_zoid = zoid WHERE blob_zoid IS NULL;
 DO $$ BEGIN
@@ -392,6 +403,11 @@ DO $$ BEGIN
 EXCEPTION WHEN OTHERS THEN NULL;
 END $$;
 
+-- Dead-letter pending jobs that can never be claimed again (e.g. after
+-- max_attempts was lowered), so they drop out of idx_teq_pending
+UPDATE text_extraction_queue SET status = 'failed', next_attempt_at = NULL
+    WHERE status = 'pending' AND attempts >= max_attempts;
+
 CREATE INDEX IF NOT EXISTS idx_teq_pending
     ON text_extraction_queue (id) WHERE status = 'pending';
 
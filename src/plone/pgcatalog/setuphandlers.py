@@ -186,6 +186,66 @@ def install(context):
             )
 
 
+def _copy_attrs(index_obj, entry, attrs):
+    """Copy the non-None *attrs* of *index_obj* into *entry*."""
+    for attr in attrs:
+        val = getattr(index_obj, attr, None)
+        if val is not None:
+            entry[attr] = val
+
+
+def _snapshot_plain(index_obj, entry):
+    """Indexes configured by their source attributes alone."""
+
+
+def _snapshot_date_range(index_obj, entry):
+    entry["since_field"] = index_obj.getSinceField()
+    entry["until_field"] = index_obj.getUntilField()
+
+
+def _snapshot_zctext(index_obj, entry):
+    # Stored whenever present, even as None, so the restore sees them
+    if hasattr(index_obj, "lexicon_id"):
+        entry["lexicon_id"] = index_obj.lexicon_id
+    if hasattr(index_obj, "index_type"):
+        entry["index_type"] = index_obj.index_type
+
+
+def _snapshot_date_recurring(index_obj, entry):
+    # DateRecurringIndex (plone.app.event)
+    _copy_attrs(index_obj, entry, ("attr_recurdef", "attr_until"))
+
+
+def _snapshot_date_range_in_range(index_obj, entry):
+    # DateRangeInRangeIndex (plone.app.event)
+    _copy_attrs(index_obj, entry, ("startindex", "endindex"))
+
+
+def _snapshot_duck_typed(index_obj, entry):
+    """Fallback for unknown meta_types: probe every known extra attribute."""
+    if hasattr(index_obj, "getSinceField"):
+        _snapshot_date_range(index_obj, entry)
+    _snapshot_zctext(index_obj, entry)
+    _snapshot_date_recurring(index_obj, entry)
+    _snapshot_date_range_in_range(index_obj, entry)
+
+
+# meta_type → extractor for type-specific extra attributes.
+_SNAPSHOT_EXTRACTORS = {
+    "FieldIndex": _snapshot_plain,
+    "KeywordIndex": _snapshot_plain,
+    "DateIndex": _snapshot_plain,
+    "BooleanIndex": _snapshot_plain,
+    "UUIDIndex": _snapshot_plain,
+    "ExtendedPathIndex": _snapshot_plain,
+    "GopipIndex": _snapshot_plain,
+    "DateRangeIndex": _snapshot_date_range,
+    "ZCTextIndex": _snapshot_zctext,
+    "DateRecurringIndex": _snapshot_date_recurring,
+    "DateRangeInRangeIndex": _snapshot_date_range_in_range,
+}
+
+
 def _snapshot_catalog(catalog):
     """Snapshot index definitions and metadata columns before replacement.
 
@@ -194,42 +254,25 @@ def _snapshot_catalog(catalog):
     - ``metadata``: [column_name, ...]
     """
     snapshot = {"indexes": {}, "metadata": []}
+    extractors = _SNAPSHOT_EXTRACTORS
 
     # Indexes
     try:
         for name, index_obj in catalog._catalog.indexes.items():
-            entry = {
-                "meta_type": getattr(index_obj, "meta_type", None),
-            }
+            meta_type = getattr(index_obj, "meta_type", None)
+            entry = {"meta_type": meta_type}
             # Source attributes
-            if hasattr(index_obj, "getIndexSourceNames"):
+            get_sources = getattr(index_obj, "getIndexSourceNames", None)
+            if get_sources is not None:
                 try:
-                    entry["source_attrs"] = list(index_obj.getIndexSourceNames())
+                    entry["source_attrs"] = list(get_sources())
                 except Exception:
                     entry["source_attrs"] = [name]
             else:
                 entry["source_attrs"] = [name]
 
             # Type-specific extra attributes
-            # DateRangeIndex
-            if hasattr(index_obj, "getSinceField"):
-                entry["since_field"] = index_obj.getSinceField()
-                entry["until_field"] = index_obj.getUntilField()
-            # ZCTextIndex
-            if hasattr(index_obj, "lexicon_id"):
-                entry["lexicon_id"] = index_obj.lexicon_id
-            if hasattr(index_obj, "index_type"):
-                entry["index_type"] = index_obj.index_type
-            # DateRecurringIndex (plone.app.event)
-            for attr in ("attr_recurdef", "attr_until"):
-                val = getattr(index_obj, attr, None)
-                if val is not None:
-                    entry[attr] = val
-            # DateRangeInRangeIndex (plone.app.event)
-            for attr in ("startindex", "endindex"):
-                val = getattr(index_obj, attr, None)
-                if val is not None:
-                    entry[attr] = val
+            extractors.get(meta_type, _snapshot_duck_typed)(index_obj, entry)
 
             snapshot["indexes"][name] = entry
     except AttributeError:
@@ -4,7 +4,8 @@ Dequeues jobs from ``text_extraction_queue``, fetches blob data from
 PG bytea or S3, sends to Apache Tika for extraction, and updates
 ``searchable_text`` (+ BM25 columns) on ``object_state``.
 
-No Zope/Plone dependency -- only ``psycopg`` and ``httpx``.
+No Zope/Plone dependency -- only ``psycopg`` (with ``psycopg_pool``)
+and ``httpx``.
 
 Usage (standalone)::
 
@@ -21,10 +22,16 @@ Environment variables:
     TIKA_WORKER_S3_ENDPOINT_URL  S3 endpoint (optional)
     TIKA_WORKER_S3_REGION     S3 region (optional)
     TIKA_WORKER_POLL_INTERVAL Seconds between polls when idle (default: 5)
+    TIKA_WORKER_BATCH_SIZE    Max jobs claimed per dequeue (default: 10)
+    TIKA_WORKER_CONCURRENCY   Parallel Tika requests (default: min(CPUs, 4))
+    TIKA_WORKER_HTTP2         Use HTTP/2 for https Tika URLs (default: off)
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from psycopg.rows import dict_row
+from psycopg_pool import ConnectionPool
 
+import codecs
 import httpx
 import logging
 import os
@@ -40,31 +47,111 @@ __all__ = ["TikaWorker", "main"]
 
 log = logging.getLogger(__name__)
 
+# Blobs above this size are streamed to Tika in STREAM_CHUNK_SIZE slices
+# instead of being loaded into worker memory in one piece.
+STREAM_THRESHOLD = 32 * 1024 * 1024
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Content types that already are plain text: they are decoded and merged
+# directly, without a Tika round-trip.
+PASSTHROUGH_TYPES = frozenset(
+    {"text/plain", "text/markdown", "text/csv", "application/json"}
+)
+
+# A failed job is retried after RETRY_BACKOFF * 2**attempts seconds.
+RETRY_BACKOFF = 5
+
+# Dequeue tiers by blob size: (name, max blob_size, batch size), capped
+# at the worker's ``stream_threshold``; blobs above it form a last tier
+# of their own, claimed one at a time.  A batch only ever holds jobs of
+# one tier, so a huge PDF never holds back a batch of small documents,
+# and the worker rotates through the tiers so neither lane starves the
+# other.
+WORKER_PROFILES = (
+    ("tiny", 1024 * 1024, 10),
+    ("small", 8 * 1024 * 1024, 5),
+    ("medium", 2**63 - 1, 2),
+)
+
+# blob_state columns for a fetch: ``data`` is only materialized for blobs
+# below the stream threshold, ``streamed`` flags the ones to slice.
+# Blob queries use binary cursors: bytea then travels as raw bytes
+# instead of hex text (half the wire size, no decode pass) and loads
+# straight into the ``bytes`` handed to httpx.
+_BLOB_COLUMNS = (
+    "CASE WHEN blob_size > %(threshold)s THEN NULL ELSE data END AS data, "
+    "s3_key, "
+    "(blob_size > %(threshold)s AND data IS NOT NULL) AS streamed"
+)
+
+# Claimable jobs of the tier ``t`` (the ``FROM``/``WHERE`` of a claim).
+_CLAIMABLE_IN_TIER = (
+    "FROM text_extraction_queue q "
+    "LEFT JOIN blob_state b "
+    "  ON b.zoid = COALESCE(q.blob_zoid, q.zoid) AND b.tid = q.tid "
+    "WHERE q.status = 'pending' "
+    "  AND q.attempts < q.max_attempts "
+    "  AND (q.next_attempt_at IS NULL OR q.next_attempt_at <= now()) "
+    "  AND COALESCE(b.blob_size, 0) >= t.min_size "
+    "  AND COALESCE(b.blob_size, 0) < t.max_size"
+)
+
 
 class TikaWorker:
     """PostgreSQL-backed text extraction worker using Apache Tika."""
 
-    def __init__(self, dsn, tika_url, s3_config=None, poll_interval=5):
+    def __init__(
+        self,
+        dsn,
+        tika_url,
+        s3_config=None,
+        poll_interval=5,
+        batch_size=10,
+        tika_concurrency=None,
+        pool=None,
+        http2=False,
+    ):
         self.dsn = dsn
         self.tika_url = tika_url.rstrip("/")
         self.s3_config = s3_config
         self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        if tika_concurrency is None:
+            tika_concurrency = min(os.cpu_count() or 1, 4)
+        self.tika_concurrency = tika_concurrency
+        self.http2 = http2
         self._shutdown = threading.Event()
+        self.stream_threshold = STREAM_THRESHOLD
+        self.profiles = WORKER_PROFILES
+        self.retry_backoff = RETRY_BACKOFF
+        self._next_profile = 0
         self._s3_client = None
+        self._client = None
+        self._client_lock = threading.Lock()
+        self._pool = pool
+        self._owns_pool = pool is None
 
     def run(self):
         """Main loop: LISTEN for notifications, process jobs."""
+        try:
+            self._listen_loop()
+        finally:
+            self.close()
+
+    def _listen_loop(self):
+        """Process jobs until shutdown, waking up on NOTIFY or poll."""
         with psycopg.connect(self.dsn, autocommit=True) as listen_conn:
             listen_conn.execute("LISTEN text_extraction_ready")
             log.info(
-                "Tika worker started (tika=%s, poll=%ds)",
+                "Tika worker started (tika=%s, poll=%ds, batch=%d)",
                 self.tika_url,
                 self.poll_interval,
+                self.batch_size,
             )
 
             while not self._shutdown.is_set():
                 # Drain all available jobs
-                while not self._shutdown.is_set() and self._process_one():
+                while not self._shutdown.is_set() and self._process_batch():
                     pass
 
                 if self._shutdown.is_set():
@@ -83,116 +170,404 @@ class TikaWorker:
                             listen_conn.close()
                         except Exception:
                             pass
-                        return self.run()  # reconnect
+                        return self._listen_loop()  # reconnect
 
         log.info("Tika worker shutting down")
 
     def _process_one(self):
         """Dequeue and process one job. Returns True if work was done."""
-        with psycopg.connect(self.dsn) as conn:
-            with conn.cursor(row_factory=dict_row) as cur:
-                # Atomic dequeue: claim one pending job
-                cur.execute(
-                    "UPDATE text_extraction_queue SET "
-                    "  status = 'processing', "
-                    "  attempts = attempts + 1, "
-                    "  updated_at = now() "
-                    "WHERE id = ("
-                    "  SELECT id FROM text_extraction_queue "
-                    "  WHERE status = 'pending' "
-                    "    AND attempts < max_attempts "
-                    "  ORDER BY id "
-                    "  FOR UPDATE SKIP LOCKED "
-                    "  LIMIT 1"
-                    ") RETURNING id, zoid, blob_zoid, tid, content_type"
-                )
-                row = cur.fetchone()
-                if row is None:
-                    conn.rollback()
-                    return False
-                conn.commit()
+        return self._process_batch(1) > 0
+
+    def _process_batch(self, batch_size=None):
+        """Dequeue and process up to ``batch_size`` jobs.
+
+        The jobs and their blobs are claimed with one ``SKIP LOCKED``
+        statement.  The Tika requests then run concurrently, and the
+        results are written on this thread in a single transaction.
+        Returns the number of jobs processed (0 when the queue is empty).
+        """
+        limit = batch_size or self.batch_size
+        with self._get_pool().connection() as conn:
+            jobs = self._claim_jobs(conn, limit)
+            if not jobs:
+                return 0
 
-            job_id = row["id"]
-            zoid = row["zoid"]
-            blob_zoid = row["blob_zoid"] or row["zoid"]  # fallback for old rows
-            tid = row["tid"]
-            content_type = row["content_type"]
+            results = self._extract_batch(conn, jobs)
 
             try:
-                text = self._extract(conn, blob_zoid, tid, content_type)
-                self._update_searchable_text(conn, zoid, text)
-                with conn.cursor() as cur:
-                    cur.execute(
-                        "UPDATE text_extraction_queue SET "
-                        "  status = 'done', error = NULL, updated_at = now() "
-                        "WHERE id = %(id)s",
-                        {"id": job_id},
+                self._apply_results(conn, jobs, results)
+            except Exception:
+                log.exception(
+                    "Failed to record batch %s, retrying job by job",
+                    [job["id"] for job in jobs],
+                )
+                for job in jobs:
+                    self._apply_job(conn, job, results)
+            return len(jobs)
+
+    def _apply_job(self, conn, job, results):
+        """Record one job after its batch failed to commit.
+
+        If even that fails, the job goes back to the queue as a failed
+        attempt, so it never stays ``processing``.
+        """
+        try:
+            self._apply_results(conn, [job], results)
+            return
+        except Exception as exc:
+            log.exception("Failed to update queue status for job %d", job["id"])
+            error = str(exc)[:1000]
+        try:
+            with conn.transaction():
+                self._finish_jobs(
+                    conn,
+                    [],
+                    [{"id": job["id"], "error": error, "backoff": self.retry_backoff}],
+                )
+        except Exception:
+            log.exception("Failed to release job %d", job["id"])
+
+    def _claim_jobs(self, conn, limit):
+        """Atomically claim pending jobs of one size tier, ordered by id.
+
+        The tiers of ``_tiers()`` are ranked round-robin, starting after
+        the one that was served last; the first tier with claimable jobs
+        yields up to its own batch size (capped at ``limit``).  Each
+        tier is an ``ORDER BY id LIMIT`` walk of ``idx_teq_pending`` that
+        stops early, and only the claimed rows are locked.  Tier choice,
+        dequeue and blob fetch are a single statement, so an idle poll
+        costs one round trip.  Each job row also carries the
+        ``blob_state`` columns of ``_BLOB_COLUMNS`` plus ``has_blob``.
+        """
+        tiers = self._tiers()
+        count = len(tiers)
+        ranked = [tiers[(self._next_profile + step) % count] for step in range(count)]
+        with conn.cursor(row_factory=dict_row, binary=True) as cur:
+            cur.execute(
+                "WITH tiers AS ("
+                " SELECT * FROM unnest("
+                "  %(mins)s::bigint[], %(maxs)s::bigint[], %(batches)s::int[]"
+                " ) WITH ORDINALITY AS t(min_size, max_size, batch, rank)"
+                "), tier AS ("
+                # No ORDER BY: the tiers are scanned in rank order and the
+                # LIMIT stops at the first one with a claimable job, so
+                # later tiers are neither probed nor locked.
+                " SELECT * FROM tiers t WHERE EXISTS ("
+                f"  SELECT 1 {_CLAIMABLE_IN_TIER} "
+                "  ORDER BY q.id LIMIT 1 FOR UPDATE OF q SKIP LOCKED"
+                " ) LIMIT 1"
+                "), chosen AS ("
+                " SELECT j.id, t.rank FROM tier t CROSS JOIN LATERAL ("
+                f"  SELECT q.id {_CLAIMABLE_IN_TIER} "
+                "  ORDER BY q.id LIMIT t.batch FOR UPDATE OF q SKIP LOCKED"
+                " ) j"
+                "), claimed AS ("
+                " UPDATE text_extraction_queue SET "
+                "  status = 'processing', "
+                "  attempts = attempts + 1, "
+                "  updated_at = now() "
+                " WHERE id IN (SELECT id FROM chosen)"
+                " RETURNING id, zoid, COALESCE(blob_zoid, zoid) AS blob_zoid, "
+                "   tid, content_type, attempts, max_attempts"
+                ") SELECT c.*, ch.rank AS tier_rank, "
+                f"  b.zoid IS NOT NULL AS has_blob, {_BLOB_COLUMNS} "
+                "FROM claimed c "
+                "JOIN chosen ch ON ch.id = c.id "
+                "LEFT JOIN blob_state b ON b.zoid = c.blob_zoid AND b.tid = c.tid "
+                "ORDER BY c.id",
+                {
+                    "mins": [min_size for min_size, _max, _batch in ranked],
+                    "maxs": [max_size for _min, max_size, _batch in ranked],
+                    "batches": [min(batch, limit) for _min, _max, batch in ranked],
+                    "threshold": self.stream_threshold,
+                },
+            )
+            jobs = cur.fetchall()
+        if not jobs:
+            conn.rollback()
+            return jobs
+        conn.commit()
+        self._next_profile = (self._next_profile + jobs[0]["tier_rank"]) % count
+        return jobs
+
+    def _tiers(self):
+        """Return the ``(min, max, batch)`` blob size ranges to dequeue.
+
+        The ``profiles`` end at ``stream_threshold``; the blobs streamed
+        above it make up the last tier, one job per batch.
+        """
+        cutoff = self.stream_threshold + 1
+        tiers = []
+        lower = 0
+        for _name, upper, batch in self.profiles:
+            upper = min(upper, cutoff)
+            if upper > lower:
+                tiers.append((lower, upper, batch))
+                lower = upper
+        tiers.append((cutoff, 2**63 - 1, 1))
+        return tiers
+
+    def _apply_results(self, conn, jobs, results):
+        """Merge the extracted texts and record the batch in one commit.
+
+        Each merge runs in a savepoint, so one bad job only fails itself;
+        the status updates are one ``executemany`` per outcome.
+        """
+        done = []
+        failed = []
+        with conn.transaction():
+            for job in jobs:
+                zoid = job["zoid"]
+                text = results[job["id"]]
+                try:
+                    if isinstance(text, Exception):
+                        raise text
+                    with conn.transaction():
+                        self._update_searchable_text(conn, zoid, text)
+                except Exception as exc:
+                    log.warning(
+                        "Extraction failed for zoid=%d blob_zoid=%d tid=%d "
+                        "(job %d): %s",
+                        zoid,
+                        job["blob_zoid"],
+                        job["tid"],
+                        job["id"],
+                        exc,
+                    )
+                    if job["attempts"] >= job["max_attempts"]:
+                        log.error(
+                            "Giving up on zoid=%d blob_zoid=%d tid=%d (job %d) "
+                            "after %d attempts",
+                            zoid,
+                            job["blob_zoid"],
+                            job["tid"],
+                            job["id"],
+                            job["attempts"],
+                        )
+                    failed.append(
+                        {
+                            "id": job["id"],
+                            "error": str(exc)[:1000],
+                            "backoff": self.retry_backoff,
+                        }
                     )
-                    conn.commit()
+                    continue
+                done.append({"id": job["id"]})
                 log.info(
                     "Extracted text for zoid=%d blob_zoid=%d tid=%d (%d chars, job %d)",
                     zoid,
-                    blob_zoid,
-                    tid,
+                    job["blob_zoid"],
+                    job["tid"],
                     len(text) if text else 0,
-                    job_id,
+                    job["id"],
                 )
-            except Exception as exc:
-                log.warning(
-                    "Extraction failed for zoid=%d blob_zoid=%d tid=%d (job %d): %s",
-                    zoid,
-                    blob_zoid,
-                    tid,
-                    job_id,
-                    exc,
+            self._finish_jobs(conn, done, failed)
+
+    def _finish_jobs(self, conn, done, failed):
+        """Record the outcome of a batch: one executemany per status."""
+        with conn.cursor() as cur:
+            if done:
+                cur.executemany(
+                    "UPDATE text_extraction_queue SET "
+                    "  status = 'done', error = NULL, next_attempt_at = NULL, "
+                    "  updated_at = now() "
+                    "WHERE id = %(id)s",
+                    done,
+                )
+            if failed:
+                cur.executemany(
+                    "UPDATE text_extraction_queue SET "
+                    "  status = CASE WHEN attempts >= max_attempts "
+                    "    THEN 'failed' ELSE 'pending' END, "
+                    "  next_attempt_at = CASE WHEN attempts < max_attempts "
+                    "    THEN now() + make_interval("
+                    "      secs => %(backoff)s * power(2, attempts)) END, "
+                    "  error = %(error)s, updated_at = now() "
+                    "WHERE id = %(id)s",
+                    failed,
                 )
+
+    def _extract_batch(self, conn, jobs):
+        """Send a batch to Tika, up to ``tika_concurrency`` PUTs at a time.
+
+        Returns a dict mapping job id to the extracted text, or to the
+        exception raised for that job.  Streamed blobs read through
+        ``conn``, which must not be shared between threads, so they are
+        sent one by one from the calling thread while the pool works.
+        """
+        results = {}
+        futures = {}
+        streamed = []
+        with ThreadPoolExecutor(
+            max_workers=min(self.tika_concurrency, len(jobs))
+        ) as pool:
+            for job in jobs:
+                if job["streamed"]:
+                    streamed.append(job)
+                    continue
+                futures[job["id"]] = pool.submit(self._extract_row, job)
+            for job in streamed:
                 try:
-                    with conn.cursor() as cur:
-                        cur.execute(
-                            "UPDATE text_extraction_queue SET "
-                            "  status = CASE WHEN attempts >= max_attempts "
-                            "    THEN 'failed' ELSE 'pending' END, "
-                            "  error = %(error)s, updated_at = now() "
-                            "WHERE id = %(id)s",
-                            {"error": str(exc)[:1000], "id": job_id},
-                        )
-                        conn.commit()
-                except Exception:
-                    log.error("Failed to update queue status for job %d", job_id)
-            return True
-
-    def _extract(self, conn, zoid, tid, content_type):
-        """Fetch blob and send to Tika, return extracted text."""
-        blob_data = self._fetch_blob(conn, zoid, tid)
+                    results[job["id"]] = self._extract(
+                        self._stream_blob(conn, job["blob_zoid"], job["tid"]),
+                        job["content_type"],
+                    )
+                except Exception as exc:
+                    results[job["id"]] = exc
+        for job_id, future in futures.items():
+            results[job_id] = future.exception() or future.result()
+        return results
+
+    def _extract_row(self, job):
+        """Extract text from an in-memory or S3 blob (runs in the pool)."""
+        row = job if job["has_blob"] else None
+        blob_data = self._blob_content(None, row, job["blob_zoid"], job["tid"])
+        return self._extract(blob_data, job["content_type"])
+
+    def _extract(self, blob_data, content_type):
+        """Send blob content to Tika, return extracted text.
+
+        Blobs of a ``PASSTHROUGH_TYPES`` type are decoded locally instead.
+        """
+        mime_type, _sep, params = (content_type or "").partition(";")
+        if mime_type.strip().lower() in PASSTHROUGH_TYPES:
+            return _decode_text(blob_data, params)
         headers = {"Accept": "text/plain"}
         if content_type:
             headers["Content-Type"] = content_type
-        with httpx.Client(timeout=120.0) as client:
-            resp = client.put(
-                f"{self.tika_url}/tika",
+        try:
+            resp = self._get_client().put(
+                "/tika",
                 content=blob_data,
                 headers=headers,
             )
-            resp.raise_for_status()
-            return resp.text
+        finally:
+            # A streamed blob left half-read must release its transaction
+            close = getattr(blob_data, "close", None)
+            if close is not None:
+                close()
+        resp.raise_for_status()
+        return resp.text
+
+    def _get_client(self):
+        """Return the worker's HTTP client, keeping Tika connections alive.
+
+        With ``http2`` (and a TLS Tika endpoint) the pool threads'
+        requests are multiplexed over one connection.  The pool threads
+        share the client, so it is created under a lock.
+        """
+        with self._client_lock:
+            if self._client is None:
+                self._client = self._make_client()
+            return self._client
+
+    def _make_client(self):
+        http2 = self.http2
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                log.warning(
+                    "HTTP/2 requested but h2 is not installed "
+                    "(pip install plone.pgcatalog[tika-http2]), using HTTP/1.1"
+                )
+                http2 = False
+        return httpx.Client(
+            base_url=self.tika_url,
+            http2=http2,
+            timeout=120.0,
+            limits=httpx.Limits(max_keepalive_connections=self.tika_concurrency),
+        )
+
+    def _get_pool(self):
+        """Return the pool the job connections are taken from.
+
+        The worker handles one batch at a time on one thread, so a
+        single pooled connection is enough; a pool passed to the
+        constructor is used as-is (and left open by ``close()``).
+        """
+        if self._pool is None:
+            self._pool = ConnectionPool(
+                self.dsn,
+                min_size=1,
+                max_size=1,
+                kwargs={"row_factory": dict_row},
+                open=True,
+            )
+        return self._pool
+
+    def close(self):
+        """Release the HTTP client and the worker's own connection pool."""
+        with self._client_lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+        if self._owns_pool and self._pool is not None:
+            self._pool.close()
+            self._pool = None
 
     def _fetch_blob(self, conn, zoid, tid):
-        """Fetch blob bytes from PG bytea or S3."""
-        with conn.cursor(row_factory=dict_row) as cur:
+        """Fetch blob content from PG bytea or S3.
+
+        Returns bytes, or an iterator of byte chunks for a bytea blob
+        larger than ``stream_threshold``.
+        """
+        with conn.cursor(row_factory=dict_row, binary=True) as cur:
             cur.execute(
-                "SELECT data, s3_key FROM blob_state "
+                f"SELECT {_BLOB_COLUMNS} FROM blob_state "
                 "WHERE zoid = %(zoid)s AND tid = %(tid)s",
-                {"zoid": zoid, "tid": tid},
+                {"zoid": zoid, "tid": tid, "threshold": self.stream_threshold},
             )
             row = cur.fetchone()
+        return self._blob_content(conn, row, zoid, tid)
+
+    def _blob_content(self, conn, row, zoid, tid):
+        """Return the content of a ``blob_state`` row for a Tika PUT."""
         if row is None:
             raise ValueError(f"No blob for zoid={zoid} tid={tid}")
+        if row["streamed"]:
+            return self._stream_blob(conn, zoid, tid)
         if row["data"] is not None:
-            return bytes(row["data"])
+            return row["data"]
         if row["s3_key"]:
             return self._fetch_from_s3(row["s3_key"])
         raise ValueError(f"Blob row has neither data nor s3_key for zoid={zoid}")
 
+    def _stream_blob(self, conn, zoid, tid):
+        """Yield a bytea blob in ``STREAM_CHUNK_SIZE`` slices.
+
+        Each slice is a ``substring()`` of the TOASTed value, so neither
+        the worker nor the server holds the whole blob in memory (large,
+        incompressible values such as PDFs are stored uncompressed and
+        sliced without detoasting the rest).
+        """
+        offset = 1  # substring() offsets are 1-based
+        with (
+            conn.transaction(),
+            conn.cursor(row_factory=dict_row, binary=True) as cur,
+        ):
+            while True:
+                cur.execute(
+                    "SELECT substring(data FROM %(offset)s FOR %(length)s) "
+                    "  AS chunk "
+                    "FROM blob_state WHERE zoid = %(zoid)s AND tid = %(tid)s",
+                    {
+                        "offset": offset,
+                        "length": STREAM_CHUNK_SIZE,
+                        "zoid": zoid,
+                        "tid": tid,
+                    },
+                    prepare=True,
+                )
+                row = cur.fetchone()
+                chunk = row["chunk"] if row else None
+                if not chunk:
+                    return
+                yield chunk
+                if len(chunk) < STREAM_CHUNK_SIZE:
+                    return
+                offset += len(chunk)
+
     def _fetch_from_s3(self, s3_key):
         """Download blob from S3."""
         import io
@@ -203,17 +578,23 @@ class TikaWorker:
         return buf.getvalue()
 
     def _get_s3_client(self):
-        if self._s3_client is None:
-            if not self.s3_config:
-                raise ValueError("S3 blob requested but no S3 config provided")
-            import boto3
-
-            self._s3_client = boto3.client(
-                "s3",
-                endpoint_url=self.s3_config.get("endpoint_url"),
-                region_name=self.s3_config.get("region_name"),
-            )
-        return self._s3_client
+        """Return the worker's S3 client.
+
+        S3 blobs are fetched from the pool threads, and ``boto3.client()``
+        is not thread-safe, so the client is created under the lock.
+        """
+        with self._client_lock:
+            if self._s3_client is None:
+                if not self.s3_config:
+                    raise ValueError("S3 blob requested but no S3 config provided")
+                import boto3
+
+                self._s3_client = boto3.client(
+                    "s3",
+                    endpoint_url=self.s3_config.get("endpoint_url"),
+                    region_name=self.s3_config.get("region_name"),
+                )
+            return self._s3_client
 
     def _update_searchable_text(self, conn, zoid, extracted_text):
         """Merge extracted text into searchable_text via PL/pgSQL function."""
@@ -222,13 +603,40 @@ class TikaWorker:
                 "SELECT pgcatalog_merge_extracted_text(%(zoid)s, %(text)s)",
                 {"zoid": zoid, "text": extracted_text},
             )
-            conn.commit()
 
     def shutdown(self):
         """Signal the worker to stop."""
         self._shutdown.set()
 
 
+def _decode_text(blob_data, params):
+    """Decode a text blob (bytes or chunk iterator) using its charset.
+
+    ``params`` is the parameter part of the content type; the charset
+    defaults to UTF-8, and undecodable bytes are replaced.  Unknown
+    charsets and non-text codecs (e.g. ``base64_codec``) fall back to
+    UTF-8.
+    """
+    encoding = "utf-8"
+    for param in params.split(";"):
+        name, _sep, value = param.partition("=")
+        if name.strip().lower() == "charset" and value.strip():
+            value = value.strip().strip('"')
+            try:
+                # bytes.decode() rejects unknown and non-text codecs alike
+                # with LookupError (empty input would skip the lookup)
+                b"a".decode(value, "replace")
+            except (LookupError, UnicodeError):
+                continue
+            encoding = value
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    if isinstance(blob_data, bytes):
+        return decoder.decode(blob_data, final=True)
+    parts = [decoder.decode(chunk) for chunk in blob_data]
+    parts.append(decoder.decode(b"", final=True))
+    return "".join(parts)
+
+
 def main():
     """CLI entry point for standalone worker."""
     logging.basicConfig(
@@ -254,12 +662,22 @@ def main():
         }
 
     poll_interval = int(os.environ.get("TIKA_WORKER_POLL_INTERVAL", "5"))
+    batch_size = int(os.environ.get("TIKA_WORKER_BATCH_SIZE", "10"))
+    concurrency = os.environ.get("TIKA_WORKER_CONCURRENCY")
+    http2 = os.environ.get("TIKA_WORKER_HTTP2", "").strip().lower() in (
+        "1",
+        "true",
+        "yes",
+    )
 
     worker = TikaWorker(
         dsn=dsn,
         tika_url=tika_url,
         s3_config=s3_config,
         poll_interval=poll_interval,
+        batch_size=batch_size,
+        tika_concurrency=int(concurrency) if concurrency else None,
+        http2=http2,
     )
 
     def handle_signal(_sig, _frame):
@@ -6,6 +6,7 @@ from plone.pgcatalog.columns import IndexType
 from plone.pgcatalog.schema import install_catalog_schema
 from plone.pgcatalog.testing import PGCATALOG_INTEGRATION_TESTING
 from psycopg.rows import dict_row
+from psycopg.rows import scalar_row
 from psycopg.types.json import Json
 from types import SimpleNamespace
 from zodb_pgjsonb.schema import HISTORY_FREE_SCHEMA
@@ -179,8 +180,9 @@ def query_zoids(conn, query_dict):
     """Execute a catalog query and return sorted list of zoids."""
     from plone.pgcatalog.query import _execute_query as execute_query
 
-    rows = execute_query(conn, query_dict, columns="zoid")
-    return sorted(row["zoid"] for row in rows)
+    return sorted(
+        execute_query(conn, query_dict, columns="zoid", row_factory=scalar_row)
+    )
 
 
 # ─────────────────────────────────────────────────────────────────────
@@ -322,3 +324,83 @@ def insert_object(conn, zoid, tid=1, class_mod="myapp", class_name="Doc", state=
         )
     conn.commit()
     return zoid
+
+
+def insert_objects_bulk(conn, zoids, tid=1, class_mod="myapp", class_name="Doc"):
+    """Insert bare object_state rows for *zoids* in one batch.
+
+    Bulk counterpart of ``insert_object`` for fixtures seeding many rows:
+    one ``executemany`` round trip instead of one INSERT per object.
+    Does not commit — callers commit once after seeding.
+    """
+    with conn.cursor() as cur:
+        cur.execute(
+            "INSERT INTO transaction_log (tid) VALUES (%(tid)s) ON CONFLICT DO NOTHING",
+            {"tid": tid},
+        )
+        cur.executemany(
+            """
+            INSERT INTO object_state
+                (zoid, tid, class_mod, class_name, state, state_size)
+            VALUES (%(zoid)s, %(tid)s, %(mod)s, %(cls)s, %(state)s, 2)
+            ON CONFLICT (zoid) DO UPDATE SET
+                tid = %(tid)s, state = %(state)s, state_size = 2
+            """,
+            [
+                {
+                    "zoid": zoid,
+                    "tid": tid,
+                    "mod": class_mod,
+                    "cls": class_name,
+                    "state": Json({}),
+                }
+                for zoid in zoids
+            ],
+        )
+    return list(zoids)
+
+
+def catalog_objects_bulk(conn, objects):
+    """Write catalog data for many objects in one batch.
+
+    *objects* is an iterable of dicts with ``zoid``, ``path`` and ``idx``
+    keys, mirroring ``catalog_object`` without searchable text.  Extra
+    idx columns are extracted per row; ``extract_extra_idx_columns``
+    always returns every registered column, so all rows share one
+    statement.  Does not commit.
+    """
+    from plone.pgcatalog.columns import compute_path_info
+    from plone.pgcatalog.columns import extract_extra_idx_columns
+
+    params = []
+    extra = {}
+    for obj in objects:
+        idx = dict(obj["idx"])
+        parent_path, path_depth = compute_path_info(obj["path"])
+        extra = extract_extra_idx_columns(idx)
+        params.append(
+            {
+                "zoid": obj["zoid"],
+                "path": obj["path"],
+                "parent_path": parent_path,
+                "path_depth": path_depth,
+                "idx": Json(idx),
+                **extra,
+            }
+        )
+    extra_set_clauses = "".join(
+        f",\n                {col} = %({col})s" for col in extra
+    )
+    with conn.cursor() as cur:
+        cur.executemany(
+            f"""
+            UPDATE object_state SET
+                path = %(path)s,
+                parent_path = %(parent_path)s,
+                path_depth = %(path_depth)s,
+                idx = %(idx)s,
+                searchable_text = NULL{extra_set_clauses}
+            WHERE zoid = %(zoid)s
+            """,
+            params,
+        )
@@ -60,6 +60,9 @@ class TestTsvectorBackend:
     def test_uncatalog_extra_empty(self):
         assert self.backend.uncatalog_extra() == {}
 
+    def test_uncatalog_columns_empty(self):
+        assert self.backend.uncatalog_columns() == ()
+
     def test_detect_always_true(self):
         assert TsvectorBackend.detect(None) is True
         assert TsvectorBackend.detect("bad_dsn") is True
@@ -272,6 +275,11 @@ class TestBM25BackendDefault:
         extra = self.backend.uncatalog_extra()
         assert extra == {"search_bm25": None, "search_bm25_en": None}
 
+    def test_uncatalog_columns_precomputed(self):
+        cols = self.backend.uncatalog_columns()
+        assert cols == ("search_bm25", "search_bm25_en")
+        assert self.backend.uncatalog_columns() is cols
+
     def test_detect_returns_false_on_bad_dsn(self):
         assert BM25Backend.detect(None) is False
         assert BM25Backend.detect("") is False
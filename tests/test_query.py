@@ -209,11 +209,22 @@ class TestDateRangeIndex:
     def test_effective_range_sql_structure(self):
         now = datetime(2025, 6, 15, tzinfo=UTC)
         qr = build_query({"effectiveRange": now})
-        # Should have: effective <= now AND (expires >= now OR expires IS NULL)
+        # Should have: effective <= now AND (expires IS NULL OR expires >= now)
         where = qr["where"]
         assert "<=" in where  # effective <= now
         assert ">=" in where  # expires >= now
-        assert "OR idx->>'expires' IS NULL" in where
+        assert "idx->>'expires' IS NULL OR" in where
+
+    def test_effective_range_is_flat_conjunction(self):
+        """No range type / compound expression: both dates are compared
+        directly against the bound parameter so the btree expression
+        indexes stay usable."""
+        now = datetime(2025, 6, 15, tzinfo=UTC)
+        qr = build_query({"effectiveRange": now})
+        where = qr["where"]
+        assert "pgcatalog_to_timestamptz(idx->>'effective') <= %(" in where
+        assert "pgcatalog_to_timestamptz(idx->>'expires') >= %(" in where
+        assert "tstzrange" not in where
 
 
 # ---------------------------------------------------------------------------
@@ -6,6 +6,7 @@ TDD: these tests are written BEFORE the implementation.
 from plone.pgcatalog.columns import IndexType
 
 import pytest
+import sys
 
 
 # ---------------------------------------------------------------------------
@@ -16,20 +17,28 @@ import pytest
 class MockIndex:
     """Minimal mock of a ZCatalog PluginIndex object."""
 
+    __slots__ = ("_indexed_attrs", "id", "meta_type")
+
     def __init__(self, meta_type, indexed_attrs=None):
         self.meta_type = meta_type
         self.id = "mock"
-        self._indexed_attrs = indexed_attrs
+        self._indexed_attrs = (
+            None
+            if indexed_attrs is None
+            else tuple(sys.intern(a) for a in indexed_attrs)
+        )
 
     def getIndexSourceNames(self):
         if self._indexed_attrs is not None:
             return self._indexed_attrs
-        return [self.id]
+        return (self.id,)
 
 
 class MockCatalog:
     """Minimal mock of a ZCatalog tool with _catalog attribute."""
 
+    __slots__ = ("_catalog",)
+
     def __init__(self, indexes=None, schema=None):
         self._catalog = MockInternalCatalog(indexes or {}, schema or {})
 
@@ -37,6 +46,8 @@ class MockCatalog:
 class MockInternalCatalog:
     """Minimal mock of Products.ZCatalog.Catalog.Catalog."""
 
+    __slots__ = ("indexes", "schema")
+
     def __init__(self, indexes, schema):
         self.indexes = indexes
         self.schema = schema
@@ -153,33 +164,29 @@ class TestSpecialIndexes:
 # ---------------------------------------------------------------------------
 
 
-class TestIndexRegistryInit:
-    """IndexRegistry starts empty."""
-
-    def test_starts_empty(self):
-        from plone.pgcatalog.columns import IndexRegistry
+@pytest.fixture(scope="module")
+def empty_registry():
+    """Shared empty IndexRegistry — only for tests that never mutate it."""
+    from plone.pgcatalog.columns import IndexRegistry
 
-        registry = IndexRegistry()
-        assert len(list(registry.keys())) == 0
+    return IndexRegistry()
 
-    def test_contains_nothing(self):
-        from plone.pgcatalog.columns import IndexRegistry
 
-        registry = IndexRegistry()
-        assert "portal_type" not in registry
+class TestIndexRegistryInit:
+    """IndexRegistry starts empty."""
 
-    def test_get_returns_default(self):
-        from plone.pgcatalog.columns import IndexRegistry
+    def test_starts_empty(self, empty_registry):
+        assert len(empty_registry) == 0
 
-        registry = IndexRegistry()
-        assert registry.get("portal_type") is None
-        assert registry.get("portal_type", "default") == "default"
+    def test_contains_nothing(self, empty_registry):
+        assert "portal_type" not in empty_registry
 
-    def test_metadata_starts_empty(self):
-        from plone.pgcatalog.columns import IndexRegistry
+    def test_get_returns_default(self, empty_registry):
+        assert empty_registry.get("portal_type") is None
+        assert empty_registry.get("portal_type", "default") == "default"
 
-        registry = IndexRegistry()
-        assert len(registry.metadata) == 0
+    def test_metadata_starts_empty(self, empty_registry):
+        assert len(empty_registry.metadata) == 0
 
 
 class TestIndexRegistrySyncFromCatalog:
@@ -283,7 +290,7 @@ class TestIndexRegistrySyncFromCatalog:
         registry = IndexRegistry()
         registry.sync_from_catalog(catalog)
 
-        assert len(list(registry.keys())) == 3
+        assert len(registry) == 3
         assert "portal_type" in registry
         assert "Subject" in registry
         assert "modified" in registry
@@ -597,73 +604,39 @@ class TestIndexRegistryResync:
 class TestValidateIdentifier:
     """validate_identifier() rejects unsafe SQL identifiers."""
 
-    def test_accepts_simple_name(self):
-        from plone.pgcatalog.columns import validate_identifier
-
-        validate_identifier("portal_type")  # no exception
-
-    def test_accepts_underscore_prefix(self):
-        from plone.pgcatalog.columns import validate_identifier
-
-        validate_identifier("_private")
-
-    def test_accepts_uppercase(self):
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "portal_type",
+            "_private",
+            "Subject",
+            "field_2",
+        ],
+    )
+    def test_accepts(self, name):
         from plone.pgcatalog.columns import validate_identifier
 
-        validate_identifier("Subject")
-
-    def test_accepts_alphanumeric(self):
-        from plone.pgcatalog.columns import validate_identifier
-
-        validate_identifier("field_2")
-
-    def test_rejects_single_quote(self):
-        from plone.pgcatalog.columns import validate_identifier
-
-        with pytest.raises(ValueError, match="Invalid identifier"):
-            validate_identifier("foo'bar")
-
-    def test_rejects_semicolon(self):
-        from plone.pgcatalog.columns import validate_identifier
-
-        with pytest.raises(ValueError, match="Invalid identifier"):
-            validate_identifier("foo;DROP TABLE")
-
-    def test_rejects_dash(self):
-        from plone.pgcatalog.columns import validate_identifier
-
-        with pytest.raises(ValueError, match="Invalid identifier"):
-            validate_identifier("my-index")
-
-    def test_rejects_space(self):
-        from plone.pgcatalog.columns import validate_identifier
-
-        with pytest.raises(ValueError, match="Invalid identifier"):
-            validate_identifier("my index")
-
-    def test_rejects_dot(self):
-        from plone.pgcatalog.columns import validate_identifier
-
-        with pytest.raises(ValueError, match="Invalid identifier"):
-            validate_identifier("schema.table")
-
-    def test_rejects_leading_digit(self):
-        from plone.pgcatalog.columns import validate_identifier
-
-        with pytest.raises(ValueError, match="Invalid identifier"):
-            validate_identifier("1field")
-
-    def test_rejects_sql_injection_payload(self):
-        from plone.pgcatalog.columns import validate_identifier
-
-        with pytest.raises(ValueError, match="Invalid identifier"):
-            validate_identifier("'; DROP TABLE object_state; --")
-
-    def test_rejects_empty_string(self):
+        validate_identifier(name)  # no exception
+
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "foo'bar",
+            "foo;DROP TABLE",
+            "my-index",
+            "my index",
+            "schema.table",
+            "1field",
+            "'; DROP TABLE object_state; --",
+            "",
+            "field\n",
+        ],
+    )
+    def test_rejects(self, name):
         from plone.pgcatalog.columns import validate_identifier
 
         with pytest.raises(ValueError, match="Invalid identifier"):
-            validate_identifier("")
+            validate_identifier(name)
 
 
 class TestIndexRegistryRejectsUnsafeNames:
@@ -4,6 +4,10 @@ from plone.pgcatalog.schema import EXPECTED_COLUMNS
 from plone.pgcatalog.schema import EXPECTED_INDEXES
 from plone.pgcatalog.schema import EXPECTED_STATISTICS
 from plone.pgcatalog.schema import install_catalog_schema
+from psycopg.types.json import Json
+
+
+_EXPECTED_COL_NAMES = list(EXPECTED_COLUMNS)
 
 
 class TestSchemaInstallation:
@@ -20,7 +24,7 @@ class TestSchemaInstallation:
                   AND column_name = ANY(%(cols)s)
                 ORDER BY column_name
                 """,
-                {"cols": list(EXPECTED_COLUMNS.keys())},
+                {"cols": _EXPECTED_COL_NAMES},
             )
             rows = cur.fetchall()
 
@@ -85,7 +89,7 @@ class TestSchemaInstallation:
                 WHERE table_name = 'object_state'
                   AND column_name = ANY(%(cols)s)
                 """,
-                {"cols": list(EXPECTED_COLUMNS.keys())},
+                {"cols": _EXPECTED_COL_NAMES},
             )
             rows = cur.fetchall()
 
@@ -94,15 +98,17 @@ class TestSchemaInstallation:
     def test_non_catalog_rows_unaffected(self, pg_conn_with_catalog):
         """Rows without catalog data have NULL in catalog columns."""
         with pg_conn_with_catalog.cursor() as cur:
-            # Insert a base transaction + object (simulating zodb-pgjsonb)
-            cur.execute("INSERT INTO transaction_log (tid) VALUES (1)")
-            cur.execute(
-                """
-                INSERT INTO object_state
-                    (zoid, tid, class_mod, class_name, state, state_size)
-                VALUES (1, 1, 'myapp', 'Foo', '{"title": "hello"}'::jsonb, 42)
-                """
-            )
+            # Insert a base transaction + object (simulating zodb-pgjsonb).
+            # COPY skips the parser/planner — keeps seeding cheap if more
+            # rows are added here later.
+            with cur.copy("COPY transaction_log (tid) FROM STDIN") as copy:
+                copy.write_row((1,))
+            with cur.copy(
+                "COPY object_state "
+                "(zoid, tid, class_mod, class_name, state, state_size) "
+                "FROM STDIN"
+            ) as copy:
+                copy.write_row((1, 1, "myapp", "Foo", Json({"title": "hello"}), 42))
         pg_conn_with_catalog.commit()
 
         with pg_conn_with_catalog.cursor() as cur:
@@ -154,7 +160,7 @@ class TestSchemaInstallation:
                 WHERE table_name = 'object_state'
                   AND column_name = ANY(%(cols)s)
                 """,
-                {"cols": list(EXPECTED_COLUMNS.keys())},
+                {"cols": _EXPECTED_COL_NAMES},
             )
             rows = cur.fetchall()
 
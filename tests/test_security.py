@@ -6,7 +6,6 @@ secured queries against real PG (integration).
 
 from datetime import datetime
 from datetime import UTC
-from plone.pgcatalog.indexing import catalog_object
 from plone.pgcatalog.query import _execute_query
 from plone.pgcatalog.query import _MAX_LIMIT
 from plone.pgcatalog.query import _MAX_OFFSET
@@ -14,8 +13,16 @@ from plone.pgcatalog.query import _MAX_SEARCH_LENGTH
 from plone.pgcatalog.query import _validate_path
 from plone.pgcatalog.query import apply_security_filters
 from plone.pgcatalog.query import build_query
-from tests.conftest import insert_object
-
+from plone.pgcatalog.schema import install_catalog_schema
+from psycopg.rows import dict_row
+from psycopg.rows import scalar_row
+from tests.conftest import catalog_objects_bulk
+from tests.conftest import DSN
+from tests.conftest import insert_objects_bulk
+from tests.conftest import TABLES_TO_DROP
+from zodb_pgjsonb.schema import HISTORY_FREE_SCHEMA
+
+import psycopg
 import pytest
 
 
@@ -46,6 +53,15 @@ class TestApplySecurityFilters:
         assert "effectiveRange" in result
         assert isinstance(result["effectiveRange"], datetime)
 
+    def test_effective_range_is_whole_second_and_shared(self):
+        query = {"portal_type": "Document"}
+        first = apply_security_filters(query, roles=["Anonymous"])
+        second = apply_security_filters(query, roles=["Anonymous"])
+        assert first["effectiveRange"].microsecond == 0
+        assert first["effectiveRange"].tzinfo is UTC
+        # Same second -> same object; a boundary crossing yields a later one.
+        assert second["effectiveRange"] >= first["effectiveRange"]
+
     def test_does_not_overwrite_existing_effective_range(self):
         now = datetime(2025, 6, 15, tzinfo=UTC)
         query = {"portal_type": "Document", "effectiveRange": now}
@@ -63,6 +79,12 @@ class TestApplySecurityFilters:
         assert "effectiveRange" not in result
         assert "show_inactive" not in result  # cleaned up
 
+    def test_show_inactive_false_in_query_dict_keeps_range(self):
+        query = {"portal_type": "Document", "show_inactive": False}
+        result = apply_security_filters(query, roles=["Anonymous"])
+        assert "effectiveRange" in result
+        assert "show_inactive" not in result
+
     def test_does_not_mutate_original(self):
         query = {"portal_type": "Document"}
         result = apply_security_filters(query, roles=["Anonymous"])
@@ -80,6 +102,19 @@ class TestApplySecurityFilters:
             "user:admin",
         }
 
+    def test_roles_query_is_fresh_list_per_call(self):
+        """Cached role normalization must not leak a shared mutable list."""
+        r1 = apply_security_filters({}, roles=["Authenticated", "Anonymous"])
+        r2 = apply_security_filters({}, roles=["Anonymous", "Authenticated"])
+        assert r1["allowedRolesAndUsers"]["query"] == ["Anonymous", "Authenticated"]
+        assert (
+            r1["allowedRolesAndUsers"]["query"] == r2["allowedRolesAndUsers"]["query"]
+        )
+        assert (
+            r1["allowedRolesAndUsers"]["query"]
+            is not r2["allowedRolesAndUsers"]["query"]
+        )
+
 
 class TestAllowedRolesColumn:
     """Test that allowedRolesAndUsers uses the dedicated allowed_roles column."""
@@ -94,6 +129,29 @@ class TestAllowedRolesColumn:
         assert "::text[]" in qr["where"]
         assert "idx->" not in qr["where"] or "allowedRolesAndUsers" not in qr["where"]
 
+    def test_sql_text_depends_only_on_shape(self):
+        """Different role sets bind as one array parameter: same SQL text,
+        so the prepared statement (and its plan) is reused."""
+        now = datetime(2025, 6, 15, tzinfo=UTC)
+        query = {"portal_type": "Document", "effectiveRange": now}
+        anon = build_query(apply_security_filters(query, roles=["Anonymous"]))
+        admin = build_query(
+            apply_security_filters(
+                query, roles=["Anonymous", "Authenticated", "Manager", "user:admin"]
+            )
+        )
+        assert anon["where"] == admin["where"]
+
+    def test_many_roles_bind_one_array_parameter(self):
+        """Any number of roles is one ``&&`` against one text[] parameter."""
+        from plone.pgcatalog.query import build_query
+
+        roles = ["Anonymous", "Authenticated", "Member", "user:jdoe", "group:x"]
+        qr = build_query({"allowedRolesAndUsers": {"query": roles, "operator": "or"}})
+        assert qr["where"].count("allowed_roles &&") == 1
+        assert " OR " not in qr["where"]
+        assert list(qr["params"].values()) == [roles]
+
     def test_allowed_roles_and_operator(self):
         from plone.pgcatalog.query import build_query
 
@@ -118,6 +176,23 @@ class TestAllowedRolesColumn:
         # portal_type uses btree expression
         assert "idx->>'portal_type'" in qr["where"]
 
+    def test_security_predicate_is_plain_where_conjunct(self):
+        """The role filter is an ordinary WHERE conjunct, never an RLS policy.
+
+        Predicates attached via row-level security become security quals,
+        which the planner cannot reorder or combine with the GIN index on
+        ``allowed_roles``.
+        """
+        from plone.pgcatalog.schema import CATALOG_COLUMNS
+        from plone.pgcatalog.schema import CATALOG_INDEXES
+
+        query = apply_security_filters({"portal_type": "Document"}, roles=["Anonymous"])
+        clauses = build_query(query)["where"].split(" AND ")
+        assert any(c.startswith("allowed_roles && ") for c in clauses)
+        ddl = (CATALOG_COLUMNS + CATALOG_INDEXES).upper()
+        assert "ROW LEVEL SECURITY" not in ddl
+        assert "CREATE POLICY" not in ddl
+
 
 # ---------------------------------------------------------------------------
 # Integration tests: secured queries against real PG
@@ -188,21 +263,47 @@ def _setup_security_data(conn):
             },
         },
     ]
-    for obj in objects:
-        insert_object(conn, zoid=obj["zoid"])
-        catalog_object(conn, zoid=obj["zoid"], path=obj["path"], idx=obj["idx"])
+    insert_objects_bulk(conn, [obj["zoid"] for obj in objects])
+    catalog_objects_bulk(conn, objects)
     conn.commit()
 
 
+@pytest.fixture(scope="module")
+def _security_conn():
+    """Module-wide connection with the security dataset committed once."""
+    conn = psycopg.connect(DSN, row_factory=dict_row)
+    conn.execute(TABLES_TO_DROP)
+    conn.execute(HISTORY_FREE_SCHEMA)
+    install_catalog_schema(conn)
+    _setup_security_data(conn)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def security_dataset(_security_conn):
+    """Shared security dataset, isolated per test by a savepoint.
+
+    The rows are inserted once per module; each test runs inside a
+    savepoint that is rolled back afterwards, so tests only ever see
+    the committed dataset.
+    """
+    conn = _security_conn
+    conn.execute("SAVEPOINT security_dataset")
+    yield conn
+    conn.execute("ROLLBACK TO SAVEPOINT security_dataset")
+    conn.rollback()
+
+
 def _query_zoids(conn, query_dict):
-    rows = _execute_query(conn, query_dict, columns="zoid")
-    return sorted(row["zoid"] for row in rows)
+    return sorted(
+        _execute_query(conn, query_dict, columns="zoid", row_factory=scalar_row)
+    )
 
 
 class TestSecurityFilterIntegration:
-    def test_anonymous_sees_public_only(self, pg_conn_with_catalog):
-        conn = pg_conn_with_catalog
-        _setup_security_data(conn)
+    def test_anonymous_sees_public_only(self, security_dataset):
+        conn = security_dataset
         query = apply_security_filters(
             {"portal_type": "Document"},
             roles=["Anonymous"],
@@ -217,9 +318,8 @@ class TestSecurityFilterIntegration:
         assert 404 in zoids
         assert 405 in zoids
 
-    def test_authenticated_sees_more(self, pg_conn_with_catalog):
-        conn = pg_conn_with_catalog
-        _setup_security_data(conn)
+    def test_authenticated_sees_more(self, security_dataset):
+        conn = security_dataset
         query = apply_security_filters(
             {"portal_type": "Document"},
             roles=["Anonymous", "Authenticated"],
@@ -232,9 +332,8 @@ class TestSecurityFilterIntegration:
         assert 403 in zoids
         assert 405 in zoids
 
-    def test_admin_sees_private(self, pg_conn_with_catalog):
-        conn = pg_conn_with_catalog
-        _setup_security_data(conn)
+    def test_admin_sees_private(self, security_dataset):
+        conn = security_dataset
         query = apply_security_filters(
             {"portal_type": "Document"},
             roles=["Anonymous", "Authenticated", "Manager", "user:admin"],
@@ -244,19 +343,17 @@ class TestSecurityFilterIntegration:
         # Admin sees everything
         assert set(zoids) == {400, 401, 402, 403, 404, 405}
 
-    def test_unrestricted_bypasses_security(self, pg_conn_with_catalog):
+    def test_unrestricted_bypasses_security(self, security_dataset):
         """Without apply_security_filters, no security filter is applied."""
-        conn = pg_conn_with_catalog
-        _setup_security_data(conn)
+        conn = security_dataset
         # Direct query without security filters
         zoids = _query_zoids(conn, {"portal_type": "Document"})
         assert set(zoids) == {400, 401, 402, 403, 404, 405}
 
 
 class TestEffectiveRangeIntegration:
-    def test_effective_range_filters_future(self, pg_conn_with_catalog):
-        conn = pg_conn_with_catalog
-        _setup_security_data(conn)
+    def test_effective_range_filters_future(self, security_dataset):
+        conn = security_dataset
         now = datetime(2025, 6, 15, tzinfo=UTC)
         query = apply_security_filters(
             {"portal_type": "Document"},
@@ -271,9 +368,8 @@ class TestEffectiveRangeIntegration:
         # 405: eff=Jan2025 ✓, exp=Dec2026 > Jun2025 ✓ → in
         assert set(zoids) == {400, 405}
 
-    def test_show_inactive_bypasses_effective_range(self, pg_conn_with_catalog):
-        conn = pg_conn_with_catalog
-        _setup_security_data(conn)
+    def test_show_inactive_bypasses_effective_range(self, security_dataset):
+        conn = security_dataset
         query = apply_security_filters(
             {"portal_type": "Document"},
             roles=["Anonymous"],
@@ -283,10 +379,9 @@ class TestEffectiveRangeIntegration:
         # No effectiveRange filter, but still security filtered
         assert set(zoids) == {400, 403, 404, 405}
 
-    def test_expired_null_never_expires(self, pg_conn_with_catalog):
+    def test_expired_null_never_expires(self, security_dataset):
         """Objects with expires=None never expire."""
-        conn = pg_conn_with_catalog
-        _setup_security_data(conn)
+        conn = security_dataset
         far_future = datetime(2099, 1, 1, tzinfo=UTC)
         query = apply_security_filters(
             {"portal_type": "Document"},
@@ -300,10 +395,9 @@ class TestEffectiveRangeIntegration:
         # 405: exp=2026 < 2099 → out
         assert set(zoids) == {400, 403}
 
-    def test_combined_security_and_date(self, pg_conn_with_catalog):
+    def test_combined_security_and_date(self, security_dataset):
         """Both security AND effectiveRange applied together."""
-        conn = pg_conn_with_catalog
-        _setup_security_data(conn)
+        conn = security_dataset
         now = datetime(2025, 6, 15, tzinfo=UTC)
         # Authenticated user
         query = apply_security_filters(
@@ -317,6 +411,46 @@ class TestEffectiveRangeIntegration:
         # Result: 400, 402, 405
         assert set(zoids) == {400, 402, 405}
 
+    def test_security_and_date_share_one_scan(self, security_dataset):
+        """Both filters are conjuncts of a single object_state scan.
+
+        No subquery, CTE or InitPlan separates them, so the planner is
+        free to combine the allowed_roles GIN index with the effective
+        btree (BitmapAnd) or to filter on either.
+        """
+        conn = security_dataset
+        conn.execute("SET LOCAL enable_seqscan = off")
+        qr = build_query(
+            apply_security_filters(
+                {"portal_type": "Document"}, roles=["Anonymous", "Authenticated"]
+            )
+        )
+        with conn.cursor() as cur:
+            cur.execute(
+                "EXPLAIN (FORMAT JSON) "
+                f"SELECT zoid FROM object_state WHERE {qr['where']}",
+                qr["params"],
+            )
+            plan = cur.fetchone()["QUERY PLAN"][0]["Plan"]
+
+        nodes, stack = [], [plan]
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            stack.extend(node.get("Plans", ()))
+        assert not any("Subplan Name" in n for n in nodes)
+        assert not any(n["Node Type"] in ("CTE Scan", "Subquery Scan") for n in nodes)
+        assert [n.get("Relation Name") for n in nodes if "Relation Name" in n] == [
+            "object_state"
+        ]
+        conds = " ".join(
+            str(n.get(key, ""))
+            for n in nodes
+            for key in ("Filter", "Index Cond", "Recheck Cond")
+        )
+        assert "allowed_roles" in conds
+        assert "effective" in conds
+
 
 # ---------------------------------------------------------------------------
 # Unit tests: hardening fixes (CAT-H1, CAT-H3, CAT-L1, CAT-L3)
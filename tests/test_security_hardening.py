@@ -98,6 +98,16 @@ class TestBM25IdentifierValidation:
         assert backend._idx_name() == "idx_os_search_bm25"
         assert backend._tok_name() == "pgcatalog_default"
 
+    def test_names_shared_across_instances(self):
+        """Names are validated once per prefix, not per construction."""
+        a = BM25Backend(languages=["en"])
+        b = BM25Backend(languages=["de"])
+        assert a._names is b._names
+
+    def test_rejects_unsafe_tokenizer_prefix(self):
+        with pytest.raises(ValueError):
+            BM25Backend(languages=["en"], tokenizer_prefix="bad; DROP")
+
 
 class TestBM25InstallSchemaSQL:
     """install_schema uses psycopg.sql for DDL construction."""
@@ -121,6 +131,16 @@ class TestBM25InstallSchemaSQL:
             f"Expected at least 4 Composed SQL calls, got {len(composed_calls)}"
         )
 
+    def test_install_statements_composed_once(self):
+        backend = BM25Backend(languages=["en"])
+        first, second = MagicMock(), MagicMock()
+        backend.install_schema(first)
+        backend.install_schema(second)
+        first_stmts = [c[0][0] for c in first.execute.call_args_list]
+        second_stmts = [c[0][0] for c in second.execute.call_args_list]
+        assert len(first_stmts) == len(second_stmts)
+        assert all(a is b for a, b in zip(first_stmts, second_stmts, strict=True))
+
 
 class TestBM25GetSchemaSqlSafety:
     """get_schema_sql returns safe DDL strings with validated identifiers."""
@@ -193,6 +213,20 @@ class TestClearCatalogDataSafeSQL:
         query = execute_call[0][0]
         assert isinstance(query, pgsql.Composed)
 
+    def test_sql_cached_per_extra_columns(self):
+        from plone.pgcatalog.maintenance import _clear_catalog_sql
+
+        reset_backend()
+        mock_conn = MagicMock()
+        mock_cursor = mock_conn.cursor.return_value.__enter__.return_value
+        mock_cursor.rowcount = 0
+
+        clear_catalog_data(mock_conn)
+        clear_catalog_data(mock_conn)
+        first, second = (c[0][0] for c in mock_cursor.execute.call_args_list)
+        assert first is second
+        assert _clear_catalog_sql(("search_bm25",)) is not first
+
     def test_extra_columns_properly_quoted(self):
         """Verify column names in the SQL are properly identifier-quoted."""
         backend = BM25Backend(languages=["en"])
@@ -260,6 +294,21 @@ class TestDRIIndexNameValidation:
                 {"query": "2025-01-01"},
             )
 
+    def test_query_rejects_trailing_newline(self):
+        translator = DateRecurringIndexTranslator(
+            date_attr="start", recurdef_attr="recurrence"
+        )
+        with pytest.raises(ValueError, match="Invalid identifier"):
+            translator.query("start\n", None, {"query": "2025-01-01"})
+
+    def test_valid_index_name_validation_is_cached(self):
+        from plone.pgcatalog.dri import _validated_index_name
+
+        _validated_index_name.cache_clear()
+        _validated_index_name("start")
+        _validated_index_name("start")
+        assert _validated_index_name.cache_info().hits == 1
+
     def test_constructor_validates_date_attr(self):
         """Constructor already validates date_attr."""
         with pytest.raises(ValueError, match="Invalid identifier"):
@@ -4,14 +4,18 @@ Tests the snapshot/replace/restore flow that preserves addon index
 definitions when replacing portal_catalog with PlonePGCatalogTool.
 """
 
+from plone.pgcatalog.catalog import PlonePGCatalogTool
 from plone.pgcatalog.setuphandlers import _build_extra
 from plone.pgcatalog.setuphandlers import _ensure_catalog_indexes
 from plone.pgcatalog.setuphandlers import _replace_catalog
 from plone.pgcatalog.setuphandlers import _restore_from_snapshot
 from plone.pgcatalog.setuphandlers import _snapshot_catalog
 from plone.pgcatalog.setuphandlers import install
+from types import SimpleNamespace
 from unittest import mock
 
+import pytest
+
 
 # ---------------------------------------------------------------------------
 # Helpers for building mock catalogs with realistic index objects
@@ -55,6 +59,23 @@ def _make_catalog_with_indexes(indexes_dict, metadata=None):
     return catalog
 
 
+# Attributes the setuphandlers helpers use on the site and the catalog.
+_SITE_SPEC = ["portal_catalog", "portal_setup", "_delObject", "_setObject", "objectIds"]
+_CATALOG_SPEC = ["indexes", "_catalog", "addIndex", "addColumn"]
+
+
+def _make_site():
+    """Spec'd mock site with a spec'd portal_catalog and portal_setup.
+
+    Specs keep Mock from auto-creating unknown attributes, so a typo
+    such as ``site.portal_catlog`` raises instead of silently passing.
+    """
+    site = mock.Mock(spec=_SITE_SPEC)
+    site.portal_catalog = mock.Mock(spec=_CATALOG_SPEC)
+    site.portal_setup = mock.Mock(spec=["runImportStepFromProfile"])
+    return site
+
+
 # ===========================================================================
 # _snapshot_catalog
 # ===========================================================================
@@ -120,6 +141,17 @@ class TestSnapshotCatalog:
         assert entry["index_type"] == "Okapi BM25 Rank"
         assert entry["source_attrs"] == ["SearchableText"]
 
+    def test_zctext_index_keeps_none_attrs(self):
+        indexes = {
+            "SearchableText": _make_index(
+                "ZCTextIndex", "SearchableText", lexicon_id=None, index_type=None
+            ),
+        }
+        catalog = _make_catalog_with_indexes(indexes)
+        entry = _snapshot_catalog(catalog)["indexes"]["SearchableText"]
+        assert entry["lexicon_id"] is None
+        assert entry["index_type"] is None
+
     def test_captures_date_recurring_index(self):
         indexes = {
             "start": _make_index(
@@ -153,6 +185,22 @@ class TestSnapshotCatalog:
         assert entry["startindex"] == "start"
         assert entry["endindex"] == "end"
 
+    def test_plain_index_has_no_extra_attrs(self):
+        indexes = {"portal_type": _make_index("FieldIndex", "portal_type")}
+        catalog = _make_catalog_with_indexes(indexes)
+        entry = _snapshot_catalog(catalog)["indexes"]["portal_type"]
+        assert set(entry) == {"meta_type", "source_attrs"}
+
+    def test_unknown_meta_type_falls_back_to_duck_typing(self):
+        idx = mock.Mock(spec=["meta_type", "getIndexSourceNames", "lexicon_id"])
+        idx.meta_type = "CustomTextIndex"
+        idx.getIndexSourceNames.return_value = ["body"]
+        idx.lexicon_id = "custom_lexicon"
+        catalog = _make_catalog_with_indexes({"body": idx})
+        entry = _snapshot_catalog(catalog)["indexes"]["body"]
+        assert entry["lexicon_id"] == "custom_lexicon"
+        assert entry["source_attrs"] == ["body"]
+
     def test_captures_metadata_columns(self):
         catalog = _make_catalog_with_indexes(
             {},
@@ -308,7 +356,7 @@ class TestBuildExtra:
 
 class TestReplaceCatalog:
     def test_replaces_existing_catalog(self):
-        site = mock.Mock()
+        site = _make_site()
         site.objectIds.return_value = ["portal_catalog"]
         with mock.patch("zope.component.getSiteManager") as gsm:
             gsm.return_value = mock.Mock()
@@ -319,7 +367,7 @@ class TestReplaceCatalog:
         assert args[0] == "portal_catalog"
 
     def test_creates_catalog_when_none_exists(self):
-        site = mock.Mock()
+        site = _make_site()
         site.objectIds.return_value = []
         with mock.patch("zope.component.getSiteManager") as gsm:
             gsm.return_value = mock.Mock()
@@ -328,9 +376,7 @@ class TestReplaceCatalog:
         site._setObject.assert_called_once()
 
     def test_new_catalog_is_PlonePGCatalogTool(self):
-        from plone.pgcatalog.catalog import PlonePGCatalogTool
-
-        site = mock.Mock()
+        site = _make_site()
         site.objectIds.return_value = []
         with mock.patch("zope.component.getSiteManager") as gsm:
             gsm.return_value = mock.Mock()
@@ -344,10 +390,19 @@ class TestReplaceCatalog:
 # ===========================================================================
 
 
+@pytest.fixture
+def restore_site():
+    """Site whose fresh portal_catalog has no indexes or metadata yet."""
+    site = _make_site()
+    site.portal_catalog.indexes.return_value = []
+    site.portal_catalog._catalog.schema.keys.return_value = []
+    return site
+
+
 class TestRestoreFromSnapshot:
-    def test_restores_addon_index(self):
+    def test_restores_addon_index(self, restore_site):
         """Addon indexes not in the fresh catalog are restored."""
-        site = mock.Mock()
+        site = restore_site
         # Fresh catalog has only UID (from core profiles)
         site.portal_catalog.indexes.return_value = ["UID"]
         site.portal_catalog._catalog.schema.keys.return_value = ["Title"]
@@ -379,9 +434,9 @@ class TestRestoreFromSnapshot:
         assert len(col_calls) == 1
         assert col_calls[0][0][0] == "my_addon_column"
 
-    def test_skips_all_existing_indexes(self):
+    def test_skips_all_existing_indexes(self, restore_site):
         """When all snapshot indexes already exist, nothing is restored."""
-        site = mock.Mock()
+        site = restore_site
         site.portal_catalog.indexes.return_value = ["UID", "portal_type"]
         site.portal_catalog._catalog.schema.keys.return_value = ["Title"]
 
@@ -400,12 +455,8 @@ class TestRestoreFromSnapshot:
         site.portal_catalog.addIndex.assert_not_called()
         site.portal_catalog.addColumn.assert_not_called()
 
-    def test_skips_entry_without_meta_type(self):
+    def test_skips_entry_without_meta_type(self, restore_site):
         """Entries with meta_type=None are skipped."""
-        site = mock.Mock()
-        site.portal_catalog.indexes.return_value = []
-        site.portal_catalog._catalog.schema.keys.return_value = []
-
         snapshot = {
             "indexes": {
                 "broken": {"meta_type": None, "source_attrs": ["x"]},
@@ -413,15 +464,12 @@ class TestRestoreFromSnapshot:
             "metadata": [],
         }
 
-        _restore_from_snapshot(site, snapshot)
-        site.portal_catalog.addIndex.assert_not_called()
+        _restore_from_snapshot(restore_site, snapshot)
+        restore_site.portal_catalog.addIndex.assert_not_called()
 
-    def test_handles_addIndex_exception(self):
+    def test_handles_addIndex_exception(self, restore_site):
         """addIndex failure is logged but doesn't stop other indexes."""
-        site = mock.Mock()
-        site.portal_catalog.indexes.return_value = []
-        site.portal_catalog._catalog.schema.keys.return_value = []
-        site.portal_catalog.addIndex.side_effect = [
+        restore_site.portal_catalog.addIndex.side_effect = [
             RuntimeError("fail"),
             None,  # second call succeeds
         ]
@@ -434,15 +482,12 @@ class TestRestoreFromSnapshot:
             "metadata": [],
         }
 
-        _restore_from_snapshot(site, snapshot)
-        assert site.portal_catalog.addIndex.call_count == 2
+        _restore_from_snapshot(restore_site, snapshot)
+        assert restore_site.portal_catalog.addIndex.call_count == 2
 
-    def test_handles_addColumn_exception(self):
+    def test_handles_addColumn_exception(self, restore_site):
         """addColumn failure is logged but doesn't stop other columns."""
-        site = mock.Mock()
-        site.portal_catalog.indexes.return_value = []
-        site.portal_catalog._catalog.schema.keys.return_value = []
-        site.portal_catalog.addColumn.side_effect = [
+        restore_site.portal_catalog.addColumn.side_effect = [
             RuntimeError("fail"),
             None,
         ]
@@ -452,15 +497,11 @@ class TestRestoreFromSnapshot:
             "metadata": ["bad_col", "good_col"],
         }
 
-        _restore_from_snapshot(site, snapshot)
-        assert site.portal_catalog.addColumn.call_count == 2
+        _restore_from_snapshot(restore_site, snapshot)
+        assert restore_site.portal_catalog.addColumn.call_count == 2
 
-    def test_passes_extra_to_addIndex(self):
+    def test_passes_extra_to_addIndex(self, restore_site):
         """The extra object built from snapshot is passed to addIndex."""
-        site = mock.Mock()
-        site.portal_catalog.indexes.return_value = []
-        site.portal_catalog._catalog.schema.keys.return_value = []
-
         snapshot = {
             "indexes": {
                 "effectiveRange": {
@@ -473,8 +514,8 @@ class TestRestoreFromSnapshot:
             "metadata": [],
         }
 
-        _restore_from_snapshot(site, snapshot)
-        extra = site.portal_catalog.addIndex.call_args[0][2]
+        _restore_from_snapshot(restore_site, snapshot)
+        extra = restore_site.portal_catalog.addIndex.call_args[0][2]
         assert extra.since_field == "effective"
         assert extra.until_field == "expires"
 
@@ -484,100 +525,95 @@ class TestRestoreFromSnapshot:
 # ===========================================================================
 
 
-class TestInstall:
-    def test_skips_without_sentinel_file(self):
-        context = mock.Mock()
-        context.readDataFile.return_value = None
-        install(context)
-        context.getSite.assert_not_called()
+@pytest.fixture
+def install_ctx():
+    """GenericSetup import context that carries the install sentinel file."""
+    site = _make_site()
+    context = mock.Mock(spec=["readDataFile", "getSite"])
+    context.readDataFile.return_value = "sentinel"
+    context.getSite.return_value = site
+    return SimpleNamespace(context=context, site=site)
 
-    def test_skips_replacement_when_already_pgcatalog(self):
-        """When catalog is already PlonePGCatalogTool, skip snapshot/replace."""
-        from plone.pgcatalog.catalog import PlonePGCatalogTool
 
-        context = mock.Mock()
-        context.readDataFile.return_value = "sentinel"
-        site = mock.Mock()
-        site.portal_catalog = PlonePGCatalogTool()
-        context.getSite.return_value = site
+# install() step helpers, by the short name used in tests.
+_INSTALL_STEPS = {
+    "snapshot": "_snapshot_catalog",
+    "replace": "_replace_catalog",
+    "ensure": "_ensure_catalog_indexes",
+    "restore": "_restore_from_snapshot",
+    "lexicons": "_remove_lexicons",
+}
 
-        with (
-            mock.patch(
-                "plone.pgcatalog.setuphandlers._ensure_catalog_indexes"
-            ) as ensure_mock,
-            mock.patch("plone.pgcatalog.setuphandlers._remove_lexicons"),
-            mock.patch("plone.pgcatalog.setuphandlers._snapshot_catalog") as snap_mock,
-            mock.patch(
-                "plone.pgcatalog.setuphandlers._replace_catalog"
-            ) as replace_mock,
-        ):
-            install(context)
-            # Should ensure indexes but NOT snapshot or replace
-            ensure_mock.assert_called_once_with(site)
-            snap_mock.assert_not_called()
-            replace_mock.assert_not_called()
 
-    def test_snapshots_and_replaces_foreign_catalog(self):
+@pytest.fixture
+def patched_setuphandlers():
+    """Patch all install() step helpers at once; yields their mocks.
+
+    A single ``patch.multiple`` resolves the target module once instead
+    of once per helper.
+    """
+    with mock.patch.multiple(
+        "plone.pgcatalog.setuphandlers",
+        **dict.fromkeys(_INSTALL_STEPS.values(), mock.DEFAULT),
+    ) as mocks:
+        yield SimpleNamespace(
+            **{short: mocks[name] for short, name in _INSTALL_STEPS.items()}
+        )
+
+
+class TestInstall:
+    def test_skips_without_sentinel_file(self, install_ctx):
+        install_ctx.context.readDataFile.return_value = None
+        install(install_ctx.context)
+        install_ctx.context.getSite.assert_not_called()
+
+    def test_skips_replacement_when_already_pgcatalog(
+        self, install_ctx, patched_setuphandlers
+    ):
+        """When catalog is already PlonePGCatalogTool, skip snapshot/replace."""
+        steps = patched_setuphandlers
+        install_ctx.site.portal_catalog = PlonePGCatalogTool()
+
+        install(install_ctx.context)
+        # Should ensure indexes but NOT snapshot or replace
+        steps.ensure.assert_called_once_with(install_ctx.site)
+        steps.snapshot.assert_not_called()
+        steps.replace.assert_not_called()
+
+    def test_snapshots_and_replaces_foreign_catalog(
+        self, install_ctx, patched_setuphandlers
+    ):
         """When catalog is a different class, snapshot → replace → restore."""
-        context = mock.Mock()
-        context.readDataFile.return_value = "sentinel"
-        site = mock.Mock()
+        steps = patched_setuphandlers
+        site = install_ctx.site
         # Old catalog is NOT PlonePGCatalogTool
         site.portal_catalog = mock.Mock(spec=["indexes", "_catalog"])
-        context.getSite.return_value = site
+        steps.snapshot.return_value = {
+            "indexes": {"x": {"meta_type": "FieldIndex"}},
+            "metadata": [],
+        }
 
-        with (
-            mock.patch(
-                "plone.pgcatalog.setuphandlers._snapshot_catalog",
-                return_value={
-                    "indexes": {"x": {"meta_type": "FieldIndex"}},
-                    "metadata": [],
-                },
-            ) as snap_mock,
-            mock.patch(
-                "plone.pgcatalog.setuphandlers._replace_catalog"
-            ) as replace_mock,
-            mock.patch(
-                "plone.pgcatalog.setuphandlers._ensure_catalog_indexes"
-            ) as ensure_mock,
-            mock.patch(
-                "plone.pgcatalog.setuphandlers._restore_from_snapshot"
-            ) as restore_mock,
-            mock.patch("plone.pgcatalog.setuphandlers._remove_lexicons"),
-        ):
-            install(context)
-            snap_mock.assert_called_once()
-            replace_mock.assert_called_once_with(site)
-            ensure_mock.assert_called_once_with(site)
-            restore_mock.assert_called_once()
+        install(install_ctx.context)
+        steps.snapshot.assert_called_once()
+        steps.replace.assert_called_once_with(site)
+        steps.ensure.assert_called_once_with(site)
+        steps.restore.assert_called_once()
 
-    def test_no_catalog_skips_snapshot(self):
+    def test_no_catalog_skips_snapshot(self, install_ctx, patched_setuphandlers):
         """When no portal_catalog exists, snapshot is skipped."""
-        context = mock.Mock()
-        context.readDataFile.return_value = "sentinel"
-        site = mock.Mock(spec=[])  # no portal_catalog attribute
-        context.getSite.return_value = site
+        steps = patched_setuphandlers
+        # no portal_catalog attribute
+        install_ctx.context.getSite.return_value = mock.Mock(spec=[])
 
-        with (
-            mock.patch("plone.pgcatalog.setuphandlers._snapshot_catalog") as snap_mock,
-            mock.patch("plone.pgcatalog.setuphandlers._replace_catalog"),
-            mock.patch("plone.pgcatalog.setuphandlers._ensure_catalog_indexes"),
-            mock.patch(
-                "plone.pgcatalog.setuphandlers._restore_from_snapshot"
-            ) as restore_mock,
-            mock.patch("plone.pgcatalog.setuphandlers._remove_lexicons"),
-        ):
-            install(context)
-            snap_mock.assert_not_called()
-            restore_mock.assert_not_called()
+        install(install_ctx.context)
+        steps.snapshot.assert_not_called()
+        steps.restore.assert_not_called()
 
-    def test_restore_called_with_snapshot(self):
+    def test_restore_called_with_snapshot(self, install_ctx, patched_setuphandlers):
         """Verify the snapshot dict is passed to _restore_from_snapshot."""
-        context = mock.Mock()
-        context.readDataFile.return_value = "sentinel"
-        site = mock.Mock()
+        steps = patched_setuphandlers
+        site = install_ctx.site
         site.portal_catalog = mock.Mock(spec=["indexes", "_catalog"])
-        context.getSite.return_value = site
 
         fake_snapshot = {
             "indexes": {
@@ -585,59 +621,33 @@ class TestInstall:
             },
             "metadata": ["addon_col"],
         }
+        steps.snapshot.return_value = fake_snapshot
 
-        with (
-            mock.patch(
-                "plone.pgcatalog.setuphandlers._snapshot_catalog",
-                return_value=fake_snapshot,
-            ),
-            mock.patch("plone.pgcatalog.setuphandlers._replace_catalog"),
-            mock.patch("plone.pgcatalog.setuphandlers._ensure_catalog_indexes"),
-            mock.patch(
-                "plone.pgcatalog.setuphandlers._restore_from_snapshot"
-            ) as restore_mock,
-            mock.patch("plone.pgcatalog.setuphandlers._remove_lexicons"),
-        ):
-            install(context)
-            restore_mock.assert_called_once_with(site, fake_snapshot)
+        install(install_ctx.context)
+        steps.restore.assert_called_once_with(site, fake_snapshot)
 
-    def test_order_is_snapshot_replace_ensure_restore_lexicons(self):
+    def test_order_is_snapshot_replace_ensure_restore_lexicons(
+        self, install_ctx, patched_setuphandlers
+    ):
         """Verify the correct execution order of install steps."""
-        context = mock.Mock()
-        context.readDataFile.return_value = "sentinel"
-        site = mock.Mock()
-        site.portal_catalog = mock.Mock(spec=["indexes", "_catalog"])
-        context.getSite.return_value = site
-
-        call_order = []
-
-        with (
-            mock.patch(
-                "plone.pgcatalog.setuphandlers._snapshot_catalog",
-                side_effect=lambda c: (
-                    call_order.append("snapshot") or {"indexes": {}, "metadata": []}
-                ),
-            ),
-            mock.patch(
-                "plone.pgcatalog.setuphandlers._replace_catalog",
-                side_effect=lambda s: call_order.append("replace"),
-            ),
-            mock.patch(
-                "plone.pgcatalog.setuphandlers._ensure_catalog_indexes",
-                side_effect=lambda s: call_order.append("ensure"),
-            ),
-            mock.patch(
-                "plone.pgcatalog.setuphandlers._restore_from_snapshot",
-                side_effect=lambda s, snap: call_order.append("restore"),
-            ),
-            mock.patch(
-                "plone.pgcatalog.setuphandlers._remove_lexicons",
-                side_effect=lambda s: call_order.append("lexicons"),
-            ),
-        ):
-            install(context)
-
-        assert call_order == ["snapshot", "replace", "ensure", "restore", "lexicons"]
+        steps = patched_setuphandlers
+        install_ctx.site.portal_catalog = mock.Mock(spec=["indexes", "_catalog"])
+
+        steps.snapshot.return_value = {"indexes": {}, "metadata": []}
+        # Attached children record their calls, in order, on the parent.
+        parent = mock.Mock()
+        for short in _INSTALL_STEPS:
+            parent.attach_mock(getattr(steps, short), short)
+
+        install(install_ctx.context)
+
+        assert [c[0] for c in parent.mock_calls] == [
+            "snapshot",
+            "replace",
+            "ensure",
+            "restore",
+            "lexicons",
+        ]
 
 
 # ===========================================================================
@@ -648,7 +658,7 @@ class TestInstall:
 class TestEnsureCatalogIndexes:
     def test_skips_if_catalog_has_essential_indexes(self):
         """Skips re-apply when essential Plone indexes (UID, portal_type) exist."""
-        site = mock.Mock()
+        site = _make_site()
         site.portal_catalog.indexes.return_value = ["UID", "portal_type", "Title"]
         _ensure_catalog_indexes(site)
         # Should not try to run import steps
@@ -659,7 +669,7 @@ class TestEnsureCatalogIndexes:
 
     def test_reapplies_if_only_addon_indexes(self):
         """Re-applies Plone defaults when essential indexes are missing."""
-        site = mock.Mock()
+        site = _make_site()
         # Addon indexes only — no UID, no portal_type
         site.portal_catalog.indexes.return_value = ["my_custom_index", "another_index"]
         _ensure_catalog_indexes(site)
@@ -674,7 +684,7 @@ class TestEnsureCatalogIndexes:
         _ensure_catalog_indexes(site)  # Should not raise
 
     def test_reapplies_profiles_for_fresh_catalog(self):
-        site = mock.Mock()
+        site = _make_site()
         site.portal_catalog.indexes.return_value = []
         _ensure_catalog_indexes(site)
         # Should have called runImportStepFromProfile for Plone profiles
@@ -685,7 +695,7 @@ class TestEnsureCatalogIndexes:
 
     def test_handles_indexes_exception(self):
         """If catalog.indexes() raises, fall through to re-apply."""
-        site = mock.Mock()
+        site = _make_site()
         site.portal_catalog.indexes.side_effect = RuntimeError("broken")
         _ensure_catalog_indexes(site)
         # Should still try to run import steps
@@ -701,7 +711,7 @@ class TestEnsureCatalogIndexes:
 
     def test_handles_profile_import_exception(self):
         """If runImportStepFromProfile raises, it's caught and logged."""
-        site = mock.Mock()
+        site = _make_site()
         site.portal_catalog.indexes.return_value = []
         site.portal_setup.runImportStepFromProfile.side_effect = RuntimeError(
             "import failed"
@@ -769,7 +779,6 @@ class TestImportToolset:
 
     def test_protects_pgcatalog_tool(self):
         """PlonePGCatalogTool installed → portal_catalog NOT deleted."""
-        from plone.pgcatalog.catalog import PlonePGCatalogTool
         from plone.pgcatalog.setuphandlers import importToolset
 
         catalog = PlonePGCatalogTool()
@@ -820,7 +829,6 @@ class TestImportToolset:
 
     def test_returns_early_when_no_toolset_xml(self):
         """No toolset.xml in profile → returns without error."""
-        from plone.pgcatalog.catalog import PlonePGCatalogTool
         from plone.pgcatalog.setuphandlers import importToolset
 
         catalog = PlonePGCatalogTool()
@@ -838,7 +846,6 @@ class TestImportToolset:
     def test_re_registers_catalog_with_correct_class(self):
         """After processing, portal_catalog is re-added to the registry
         with PlonePGCatalogTool class path."""
-        from plone.pgcatalog.catalog import PlonePGCatalogTool
         from plone.pgcatalog.setuphandlers import importToolset
 
         catalog = PlonePGCatalogTool()
@@ -872,7 +879,6 @@ class TestImportToolset:
 
     def test_processes_other_required_tools(self):
         """Non-catalog required tools are still processed normally."""
-        from plone.pgcatalog.catalog import PlonePGCatalogTool
         from plone.pgcatalog.setuphandlers import importToolset
 
         catalog = PlonePGCatalogTool()
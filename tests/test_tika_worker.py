@@ -1,13 +1,18 @@
 """Tests for TikaWorker (text extraction worker)."""
 
+from datetime import timedelta
 from plone.pgcatalog.schema import CATALOG_COLUMNS
 from plone.pgcatalog.schema import CATALOG_FUNCTIONS
 from plone.pgcatalog.schema import CATALOG_LANG_FUNCTION
 from plone.pgcatalog.schema import TEXT_EXTRACTION_QUEUE
 from plone.pgcatalog.schema import TSVECTOR_MERGE_FUNCTION
+from plone.pgcatalog.tika_worker import _decode_text
+from plone.pgcatalog.tika_worker import RETRY_BACKOFF
+from plone.pgcatalog.tika_worker import STREAM_CHUNK_SIZE
 from plone.pgcatalog.tika_worker import TikaWorker
 from psycopg.rows import dict_row
 from psycopg.types.json import Json
+from psycopg_pool import ConnectionPool
 from tests.conftest import DSN
 from unittest.mock import MagicMock
 from unittest.mock import patch
@@ -17,6 +22,7 @@ import os
 import psycopg
 import pytest
 import threading
+import time
 
 
 pytestmark = pytest.mark.skipif(not DSN, reason="No PostgreSQL DSN configured")
@@ -28,9 +34,9 @@ TABLES_TO_DROP = (
 )
 
 
-@pytest.fixture
-def worker_db():
-    """Fresh DB with all required tables for worker tests."""
+@pytest.fixture(scope="module")
+def _worker_schema():
+    """Create all tables required by the worker once per module."""
     conn = psycopg.connect(DSN, row_factory=dict_row)
     conn.execute(TABLES_TO_DROP)
     conn.commit()
@@ -60,6 +66,34 @@ def worker_db():
     conn.close()
 
 
+@pytest.fixture
+def worker_db(_worker_schema):
+    """Empty worker tables; the schema itself is shared by the module."""
+    conn = _worker_schema
+    conn.execute(
+        "TRUNCATE text_extraction_queue, blob_state, object_state, "
+        "transaction_log RESTART IDENTITY CASCADE"
+    )
+    conn.commit()
+    yield conn
+    conn.rollback()
+
+
+@pytest.fixture
+def make_worker():
+    """Build TikaWorkers that are closed, with their own pools, on teardown."""
+    workers = []
+
+    def make(**kwargs):
+        worker = TikaWorker(**kwargs)
+        workers.append(worker)
+        return worker
+
+    yield make
+    for worker in workers:
+        worker.close()
+
+
 def _insert_object_with_blob(conn, zoid, tid=1, blob_data=b"fake pdf", idx=None):
     """Insert an object_state row + blob_state row."""
     with conn.cursor() as cur:
@@ -84,6 +118,93 @@ def _insert_object_with_blob(conn, zoid, tid=1, blob_data=b"fake pdf", idx=None)
     conn.commit()
 
 
+def _bulk_insert_objects_with_blobs(conn, specs, tid=1, idx=None, enqueue=False):
+    """Insert object_state + blob_state rows for ``(zoid, blob_data)`` specs.
+
+    One ``executemany`` per table and a single commit; with ``enqueue``
+    each object also gets an ``application/pdf`` extraction job.
+    """
+    rows = [
+        {
+            "zoid": zoid,
+            "tid": tid,
+            "state": Json({}),
+            "idx": Json(idx or {}),
+            "size": len(blob_data),
+            "data": blob_data,
+            "ct": "application/pdf",
+        }
+        for zoid, blob_data in specs
+    ]
+    with conn.cursor() as cur:
+        cur.execute(
+            "INSERT INTO transaction_log (tid) VALUES (%(tid)s) ON CONFLICT DO NOTHING",
+            {"tid": tid},
+        )
+        cur.executemany(
+            "INSERT INTO object_state "
+            "(zoid, tid, class_mod, class_name, state, state_size, idx) "
+            "VALUES (%(zoid)s, %(tid)s, 'test', 'Doc', %(state)s, 10, %(idx)s) "
+            "ON CONFLICT (zoid) DO UPDATE SET "
+            "tid = %(tid)s, idx = %(idx)s",
+            rows,
+        )
+        cur.executemany(
+            "INSERT INTO blob_state (zoid, tid, blob_size, data) "
+            "VALUES (%(zoid)s, %(tid)s, %(size)s, %(data)s) "
+            "ON CONFLICT DO NOTHING",
+            rows,
+        )
+        if enqueue:
+            cur.executemany(
+                "INSERT INTO text_extraction_queue "
+                "(zoid, blob_zoid, tid, content_type) "
+                "VALUES (%(zoid)s, %(zoid)s, %(tid)s, %(ct)s) "
+                "ON CONFLICT DO NOTHING",
+                rows,
+            )
+    conn.commit()
+
+
+def _bulk_copy_objects_with_blobs(conn, specs, tid=1):
+    """Seed object_state + blob_state rows for ``(zoid, blob_data)`` specs.
+
+    Uses ``COPY ... FROM STDIN`` instead of INSERTs, which keeps seeding
+    hundreds of rows cheap.  The tables must not hold these zoids yet.
+    """
+    with conn.cursor() as cur:
+        cur.execute(
+            "INSERT INTO transaction_log (tid) VALUES (%(tid)s) ON CONFLICT DO NOTHING",
+            {"tid": tid},
+        )
+        with cur.copy(
+            "COPY object_state "
+            "(zoid, tid, class_mod, class_name, state, state_size, idx) "
+            "FROM STDIN"
+        ) as copy:
+            for zoid, _blob_data in specs:
+                copy.write_row((zoid, tid, "test", "Doc", Json({}), 10, Json({})))
+        with cur.copy(
+            "COPY blob_state (zoid, tid, blob_size, data) FROM STDIN"
+        ) as copy:
+            for zoid, blob_data in specs:
+                copy.write_row((zoid, tid, len(blob_data), blob_data))
+    conn.commit()
+
+
+def _bulk_copy_queue(conn, rows):
+    """Seed extraction jobs from ``(zoid, tid, content_type)`` rows via COPY."""
+    with (
+        conn.cursor() as cur,
+        cur.copy(
+            "COPY text_extraction_queue (zoid, blob_zoid, tid, content_type) FROM STDIN"
+        ) as copy,
+    ):
+        for zoid, tid, content_type in rows:
+            copy.write_row((zoid, zoid, tid, content_type))
+    conn.commit()
+
+
 def _enqueue_job(conn, zoid, tid=1, content_type="application/pdf", blob_zoid=None):
     """Insert a job into text_extraction_queue."""
     with conn.cursor() as cur:
@@ -102,6 +223,20 @@ def _enqueue_job(conn, zoid, tid=1, content_type="application/pdf", blob_zoid=No
     conn.commit()
 
 
+def _make_tika_mock(mock_client_cls, text="extracted", side_effect=None):
+    """Set up a patched ``httpx.Client`` class; return the client mock.
+
+    Each ``put`` answers with a response carrying ``text``, unless a
+    ``side_effect`` is given.
+    """
+    mock_response = MagicMock()
+    mock_response.text = text
+    mock_client = mock_client_cls.return_value
+    mock_client.put.return_value = mock_response
+    mock_client.put.side_effect = side_effect
+    return mock_client
+
+
 def _get_queue_status(conn, zoid):
     """Return the status of the queue entry for a zoid."""
     with conn.cursor(row_factory=dict_row) as cur:
@@ -115,46 +250,66 @@ def _get_queue_status(conn, zoid):
 class TestWorkerFetchBlob:
     """Test blob fetching from PG bytea."""
 
-    def test_fetch_bytea_blob(self, worker_db):
+    def test_fetch_bytea_blob(self, worker_db, make_worker):
         conn = worker_db
         blob_data = b"Hello from PDF"
         _insert_object_with_blob(conn, zoid=1, tid=1, blob_data=blob_data)
 
-        worker = TikaWorker(dsn=DSN, tika_url="http://localhost:9998")
-        with psycopg.connect(DSN) as fetch_conn:
-            result = worker._fetch_blob(fetch_conn, 1, 1)
-        assert result == blob_data
-
-    def test_fetch_missing_blob_raises(self, worker_db):
-        worker = TikaWorker(dsn=DSN, tika_url="http://localhost:9998")
+        with ConnectionPool(
+            DSN, min_size=1, max_size=1, kwargs={"row_factory": dict_row}
+        ) as pool:
+            worker = make_worker(dsn=DSN, tika_url="http://localhost:9998", pool=pool)
+            with worker._get_pool().connection() as fetch_conn:
+                result = worker._fetch_blob(fetch_conn, 1, 1)
+            assert isinstance(result, bytes)
+            assert result == blob_data
+
+    def test_fetch_missing_blob_raises(self, worker_db, make_worker):
+        worker = make_worker(dsn=DSN, tika_url="http://localhost:9998")
         with (
             psycopg.connect(DSN) as fetch_conn,
             pytest.raises(ValueError, match="No blob"),
         ):
             worker._fetch_blob(fetch_conn, 999, 999)
 
+    def test_fetch_large_blob_streams(self, worker_db, make_worker):
+        conn = worker_db
+        blob_data = bytes(range(256)) * (STREAM_CHUNK_SIZE // 256) * 2 + b"tail"
+        _insert_object_with_blob(conn, zoid=2, tid=1, blob_data=blob_data)
+
+        worker = make_worker(dsn=DSN, tika_url="http://localhost:9998")
+        worker.stream_threshold = STREAM_CHUNK_SIZE
+        with psycopg.connect(DSN) as fetch_conn:
+            result = worker._fetch_blob(fetch_conn, 2, 1)
+            assert not isinstance(result, bytes)
+            chunks = list(result)
+        assert [len(c) for c in chunks] == [STREAM_CHUNK_SIZE] * 2 + [4]
+        assert b"".join(chunks) == blob_data
+
+    def test_fetch_small_blob_not_streamed(self, worker_db, make_worker):
+        conn = worker_db
+        _insert_object_with_blob(conn, zoid=3, tid=1, blob_data=b"small")
+
+        worker = make_worker(dsn=DSN, tika_url="http://localhost:9998")
+        worker.stream_threshold = 5
+        with psycopg.connect(DSN) as fetch_conn:
+            assert worker._fetch_blob(fetch_conn, 3, 1) == b"small"
+
 
 class TestWorkerProcessOne:
     """Test dequeue + processing logic (mocked Tika)."""
 
     @patch("plone.pgcatalog.tika_worker.httpx.Client")
-    def test_process_one_success(self, mock_client_cls, worker_db):
+    def test_process_one_success(self, mock_client_cls, worker_db, make_worker):
         conn = worker_db
         zoid, tid = 10, 1
         _insert_object_with_blob(conn, zoid, tid, blob_data=b"%PDF-fake")
         _enqueue_job(conn, zoid, tid)
 
         # Mock Tika response
-        mock_response = MagicMock()
-        mock_response.text = "Extracted text from PDF"
-        mock_response.raise_for_status = MagicMock()
-        mock_client = MagicMock()
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
-        mock_client.put.return_value = mock_response
-        mock_client_cls.return_value = mock_client
-
-        worker = TikaWorker(dsn=DSN, tika_url="http://tika:9998")
+        _make_tika_mock(mock_client_cls, "Extracted text from PDF")
+
+        worker = make_worker(dsn=DSN, tika_url="http://tika:9998")
         result = worker._process_one()
         assert result is True
 
@@ -164,20 +319,16 @@ class TestWorkerProcessOne:
         assert status["error"] is None
 
     @patch("plone.pgcatalog.tika_worker.httpx.Client")
-    def test_process_one_failure_retries(self, mock_client_cls, worker_db):
+    def test_process_one_failure_retries(self, mock_client_cls, worker_db, make_worker):
         conn = worker_db
         zoid, tid = 20, 1
         _insert_object_with_blob(conn, zoid, tid)
         _enqueue_job(conn, zoid, tid)
 
         # Mock Tika failure
-        mock_client = MagicMock()
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
-        mock_client.put.side_effect = Exception("Tika unavailable")
-        mock_client_cls.return_value = mock_client
+        _make_tika_mock(mock_client_cls, side_effect=Exception("Tika unavailable"))
 
-        worker = TikaWorker(dsn=DSN, tika_url="http://tika:9998")
+        worker = make_worker(dsn=DSN, tika_url="http://tika:9998")
         result = worker._process_one()
         assert result is True
 
@@ -187,17 +338,482 @@ class TestWorkerProcessOne:
         assert status["attempts"] == 1
         assert "Tika unavailable" in status["error"]
 
-    def test_process_one_empty_queue(self, worker_db):
-        worker = TikaWorker(dsn=DSN, tika_url="http://tika:9998")
+    @patch("plone.pgcatalog.tika_worker.httpx.Client")
+    def test_process_batch_mixed_results(self, mock_client_cls, worker_db, make_worker):
+        conn = worker_db
+        _bulk_insert_objects_with_blobs(
+            conn,
+            [(zoid, f"doc {zoid}".encode()) for zoid in (40, 41, 42)],
+            enqueue=True,
+        )
+        _enqueue_job(conn, 43, 1)  # no blob_state row
+
+        def put(url, content, headers):
+            if content == b"doc 41":
+                raise Exception("Tika choked")
+            response = MagicMock()
+            response.text = "extracted"
+            return response
+
+        _make_tika_mock(mock_client_cls, side_effect=put)
+
+        worker = make_worker(dsn=DSN, tika_url="http://tika:9998", batch_size=10)
+        worker.retry_backoff = 0
+        assert worker._process_batch() == 4
+
+        assert _get_queue_status(conn, 40)["status"] == "done"
+        assert _get_queue_status(conn, 42)["status"] == "done"
+        failed = _get_queue_status(conn, 41)
+        assert failed["status"] == "pending"
+        assert "Tika choked" in failed["error"]
+        missing = _get_queue_status(conn, 43)
+        assert missing["status"] == "pending"
+        assert "No blob" in missing["error"]
+        # Retried right away without a backoff
+        assert worker._process_batch() == 2
+
+    @patch("plone.pgcatalog.tika_worker.httpx.Client")
+    def test_client_reused_across_jobs(self, mock_client_cls, worker_db, make_worker):
+        conn = worker_db
+        _bulk_insert_objects_with_blobs(
+            conn, [(70, b"fake pdf"), (71, b"fake pdf")], enqueue=True
+        )
+
+        mock_client = _make_tika_mock(mock_client_cls)
+
+        worker = make_worker(dsn=DSN, tika_url="http://tika:9998/")
+        assert worker._process_one() is True
+        assert worker._process_one() is True
+
+        # One keep-alive client for both jobs, PUTs relative to base_url
+        mock_client_cls.assert_called_once()
+        assert mock_client_cls.call_args.kwargs["base_url"] == "http://tika:9998"
+        assert [c.args[0] for c in mock_client.put.call_args_list] == [
+            "/tika",
+            "/tika",
+        ]
+
+        worker.close()
+        mock_client.close.assert_called_once_with()
+        assert worker._client is None
+
+    @patch("plone.pgcatalog.tika_worker.httpx.Client")
+    def test_process_large_blob_streams_to_tika(
+        self, mock_client_cls, worker_db, make_worker
+    ):
+        conn = worker_db
+        zoid, tid = 80, 1
+        blob_data = b"%PDF" + b"x" * (STREAM_CHUNK_SIZE + 10)
+        _insert_object_with_blob(conn, zoid, tid, blob_data=blob_data)
+        _enqueue_job(conn, zoid, tid)
+
+        sent = []
+
+        def put(url, content, headers):
+            sent.extend(content)  # httpx consumes iterables chunk by chunk
+            response = MagicMock()
+            response.text = "extracted"
+            return response
+
+        _make_tika_mock(mock_client_cls, side_effect=put)
+
+        worker = make_worker(dsn=DSN, tika_url="http://tika:9998")
+        worker.stream_threshold = STREAM_CHUNK_SIZE
+        assert worker._process_one() is True
+
+        assert len(sent) == 2
+        assert b"".join(sent) == blob_data
+        assert _get_queue_status(conn, zoid)["status"] == "done"
+
+    @patch("plone.pgcatalog.tika_worker.httpx.Client")
+    def test_process_batch_puts_concurrently(
+        self, mock_client_cls, worker_db, make_worker
+    ):
+        conn = worker_db
+        words = {90: "quantum", 91: "astronomy"}
+        _bulk_insert_objects_with_blobs(
+            conn,
+            [(zoid, word.encode()) for zoid, word in words.items()],
+            idx={"Language": "en"},
+            enqueue=True,
+        )
+
+        # Both PUTs must be in flight at once to pass the barrier; the
+        # first job answers last, so results arrive out of order.
+        barrier = threading.Barrier(2, timeout=5)
+
+        def put(url, content, headers):
+            barrier.wait()
+            if content == b"quantum":
+                time.sleep(0.1)
+            response = MagicMock()
+            response.text = content.decode()
+            return response
+
+        _make_tika_mock(mock_client_cls, side_effect=put)
+
+        worker = make_worker(dsn=DSN, tika_url="http://tika:9998", tika_concurrency=2)
+        assert worker._process_batch() == 2
+
+        for zoid, word in words.items():
+            assert _get_queue_status(conn, zoid)["status"] == "done"
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT searchable_text::text FROM object_state "
+                    "WHERE zoid = %(zoid)s",
+                    {"zoid": zoid},
+                )
+                tsv_text = cur.fetchone()["searchable_text"]
+            # Each text merged into its own object, whatever the order
+            assert word[:5] in tsv_text
+            assert all(w[:5] not in tsv_text for w in words.values() if w != word)
+
+    def test_claim_rotates_size_tiers(self, worker_db, make_worker):
+        conn = worker_db
+        # The large job is oldest, but must not join a batch of small ones
+        _insert_object_with_blob(conn, 200, 1, blob_data=b"L" * 100)
+        _enqueue_job(conn, 200, 1)
+        _bulk_insert_objects_with_blobs(
+            conn, [(zoid, b"s") for zoid in (201, 202, 203, 204)], enqueue=True
+        )
+
+        worker = make_worker(dsn=DSN, tika_url="http://tika:9998")
+        worker.profiles = (("small", 2**63 - 1, 3),)
+        worker.stream_threshold = 9
+
+        def claim():
+            with psycopg.connect(DSN) as claim_conn:
+                return [job["zoid"] for job in worker._claim_jobs(claim_conn, 10)]
+
+        assert claim() == [201, 202, 203]
+        # The next dequeue serves the large lane before more small jobs
+        assert claim() == [200]
+        assert claim() == [204]
+        assert claim() == []
+
+    def test_tiers_end_at_stream_threshold(self, make_worker):
+        worker = make_worker(dsn=DSN, tika_url="http://tika:9998")
+        worker.stream_threshold = 4 * 1024 * 1024
+        assert worker._tiers() == [
+            (0, 1024 * 1024, 10),
+            (1024 * 1024, 4 * 1024 * 1024 + 1, 5),
+            (4 * 1024 * 1024 + 1, 2**63 - 1, 1),
+        ]
+
+    @patch("plone.pgcatalog.tika_worker.httpx.Client")
+    def test_process_batch_failures_retry(
+        self, mock_client_cls, worker_db, make_worker
+    ):
+        conn = worker_db
+        zoids = (210, 211, 212)
+        _bulk_insert_objects_with_blobs(
+            conn, [(zoid, b"fake pdf") for zoid in zoids], enqueue=True
+        )
+
+        _make_tika_mock(mock_client_cls, side_effect=Exception("Tika unavailable"))
+
+        worker = make_worker(dsn=DSN, tika_url="http://tika:9998")
+        assert worker._process_batch() == 3
+
+        for zoid in zoids:
+            status = _get_queue_status(conn, zoid)
+            assert status["status"] == "pending"
+            assert status["attempts"] == 1
+            assert "Tika unavailable" in status["error"]
+
+    @patch("plone.pgcatalog.tika_worker.httpx.Client")
+    def test_process_batch_writes_in_one_transaction(
+        self, mock_client_cls, worker_db, make_worker
+    ):
+        conn = worker_db
+        zoid, tid = 220, 1
+        _insert_object_with_blob(conn, zoid, tid, idx={"Language": "en"})
+        _enqueue_job(conn, zoid, tid)
+
+        _make_tika_mock(mock_client_cls, "quantum")
+
+        worker = make_worker(dsn=DSN, tika_url="http://tika:9998")
+        with patch.object(worker, "_finish_jobs", side_effect=Exception("boom")):
+            assert worker._process_batch() == 1
+
+        # The status update failed, so the merge was rolled back with it
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT searchable_text FROM object_state WHERE zoid = %(zoid)s",
+                {"zoid": zoid},
+            )
+            assert cur.fetchone()["searchable_text"] is None
+        assert _get_queue_status(conn, zoid)["status"] == "processing"
+
+    @patch("plone.pgcatalog.tika_worker.httpx.Client")
+    def test_failed_batch_write_falls_back_per_job(
+        self, mock_client_cls, worker_db, make_worker
+    ):
+        conn = worker_db
+        _bulk_insert_objects_with_blobs(
+            conn, [(zoid, b"fake pdf") for zoid in (230, 231)], enqueue=True
+        )
+        _make_tika_mock(mock_client_cls)
+
+        worker = make_worker(dsn=DSN, tika_url="http://tika:9998")
+        finish_jobs = worker._finish_jobs
+
+        def flaky_finish(conn, done, failed):
+            if len(done) + len(failed) > 1:
+                raise psycopg.OperationalError("batch write failed")
+            return finish_jobs(conn, done, failed)
+
+        with patch.object(worker, "_finish_jobs", flaky_finish):
+            assert worker._process_batch() == 2
+
+        assert _get_queue_status(conn, 230)["status"] == "done"
+        assert _get_queue_status(conn, 231)["status"] == "done"
+
+    @patch("plone.pgcatalog.tika_worker.httpx.Client")
+    def test_failed_job_write_requeues_job(
+        self, mock_client_cls, worker_db, make_worker
+    ):
+        conn = worker_db
+        zoid = 232
+        _insert_object_with_blob(conn, zoid)
+        _enqueue_job(conn, zoid)
+        _make_tika_mock(mock_client_cls)
+
+        worker = make_worker(dsn=DSN, tika_url="http://tika:9998")
+        finish_jobs = worker._finish_jobs
+
+        def finish_without_done(conn, done, failed):
+            if done:
+                raise psycopg.OperationalError("write failed")
+            return finish_jobs(conn, done, failed)
+
+        with patch.object(worker, "_finish_jobs", finish_without_done):
+            assert worker._process_one() is True
+
+        status = _get_queue_status(conn, zoid)
+        assert status["status"] == "pending"
+        assert "write failed" in status["error"]
+
+    @patch("plone.pgcatalog.tika_worker.httpx.Client")
+    def test_external_pool_reused_and_left_open(
+        self, mock_client_cls, worker_db, make_worker
+    ):
+        conn = worker_db
+        _bulk_insert_objects_with_blobs(
+            conn, [(230, b"fake pdf"), (231, b"fake pdf")], enqueue=True
+        )
+
+        _make_tika_mock(mock_client_cls)
+
+        with ConnectionPool(
+            DSN, min_size=1, max_size=1, kwargs={"row_factory": dict_row}
+        ) as pool:
+            worker = make_worker(dsn=DSN, tika_url="http://tika:9998", pool=pool)
+            assert worker._process_one() is True
+            assert worker._process_one() is True
+            assert pool.get_stats()["connections_num"] == 1
+
+            worker.close()
+            assert not pool.closed
+
+        assert _get_queue_status(conn, 230)["status"] == "done"
+        assert _get_queue_status(conn, 231)["status"] == "done"
+
+    def test_own_pool_closed(self, worker_db, make_worker):
+        worker = make_worker(dsn=DSN, tika_url="http://tika:9998")
+        assert worker._process_one() is False
+        pool = worker._get_pool()
+        assert worker._get_pool() is pool
+
+        worker.close()
+        assert pool.closed
+        assert worker._pool is None
+
+    @patch("plone.pgcatalog.tika_worker.httpx.Client")
+    def test_fetch_and_dequeue_one_query(self, mock_client_cls, worker_db, make_worker):
+        conn = worker_db
+        _bulk_insert_objects_with_blobs(
+            conn, [(zoid, f"doc {zoid}".encode()) for zoid in (240, 241)], enqueue=True
+        )
+
+        sent = []
+        mock_client = _make_tika_mock(mock_client_cls)
+        mock_client.put.side_effect = lambda url, content, headers: (
+            sent.append(content) or mock_client.put.return_value
+        )
+
+        executed = []
+        real_execute = psycopg.Cursor.execute
+
+        def execute(cur, query, *args, **kwargs):
+            executed.append(str(query))
+            return real_execute(cur, query, *args, **kwargs)
+
+        worker = make_worker(dsn=DSN, tika_url="http://tika:9998")
+        with patch.object(psycopg.Cursor, "execute", execute):
+            assert worker._process_batch() == 2
+
+        # The claim statement returned the blobs; nothing else read them
+        assert sorted(sent) == [b"doc 240", b"doc 241"]
+        assert sum("blob_state" in query for query in executed) == 1
+
+    @patch("plone.pgcatalog.tika_worker.httpx.Client")
+    def test_failure_backoff_delays_requeue(
+        self, mock_client_cls, worker_db, make_worker
+    ):
+        conn = worker_db
+        zoid, tid = 250, 1
+        _insert_object_with_blob(conn, zoid, tid)
+        _enqueue_job(conn, zoid, tid)
+
+        _make_tika_mock(mock_client_cls, side_effect=Exception("Tika unavailable"))
+
+        worker = make_worker(dsn=DSN, tika_url="http://tika:9998")
+        assert worker._process_one() is True
+
+        # Pending again, but held back by RETRY_BACKOFF * 2**attempts
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT status, next_attempt_at - updated_at AS delay "
+                "FROM text_extraction_queue WHERE zoid = %(zoid)s",
+                {"zoid": zoid},
+            )
+            row = cur.fetchone()
+        assert row["status"] == "pending"
+        assert row["delay"] == timedelta(seconds=RETRY_BACKOFF * 2)
+        assert worker._process_one() is False
+
+        # Once the backoff has elapsed the job is claimed again
+        conn.execute(
+            "UPDATE text_extraction_queue SET next_attempt_at = now() "
+            "WHERE zoid = %(zoid)s",
+            {"zoid": zoid},
+        )
+        conn.commit()
+        assert worker._process_one() is True
+        assert _get_queue_status(conn, zoid)["attempts"] == 2
+
+    @patch("plone.pgcatalog.tika_worker.httpx.Client")
+    def test_last_failed_attempt_marks_failed(
+        self, mock_client_cls, worker_db, make_worker
+    ):
+        conn = worker_db
+        zoid, tid = 251, 1
+        _insert_object_with_blob(conn, zoid, tid)
+        _enqueue_job(conn, zoid, tid)
+        conn.execute(
+            "UPDATE text_extraction_queue SET attempts = max_attempts - 1 "
+            "WHERE zoid = %(zoid)s",
+            {"zoid": zoid},
+        )
+        conn.commit()
+
+        _make_tika_mock(mock_client_cls, side_effect=Exception("Tika unavailable"))
+
+        worker = make_worker(dsn=DSN, tika_url="http://tika:9998")
+        assert worker._process_one() is True
+
+        status = _get_queue_status(conn, zoid)
+        assert status["status"] == "failed"
+        assert status["next_attempt_at"] is None
+
+    @patch("plone.pgcatalog.tika_worker.httpx.Client")
+    def test_process_one_gives_up_after_max_attempts(
+        self, mock_client_cls, worker_db, make_worker
+    ):
+        conn = worker_db
+        zoid, tid = 252, 1
+        _insert_object_with_blob(conn, zoid, tid)
+        _enqueue_job(conn, zoid, tid)
+
+        mock_client = _make_tika_mock(
+            mock_client_cls, side_effect=Exception("Tika unavailable")
+        )
+
+        worker = make_worker(dsn=DSN, tika_url="http://tika:9998")
+        worker.retry_backoff = 0
+        for _ in range(3):
+            assert worker._process_one() is True
+
+        # Terminal: the job is never dequeued again
+        assert worker._process_one() is False
+        status = _get_queue_status(conn, zoid)
+        assert status["status"] == "failed"
+        assert status["attempts"] == 3
+        assert "Tika unavailable" in status["error"]
+        assert mock_client.put.call_count == 3
+
+    def test_schema_dead_letters_exhausted_pending_jobs(self, worker_db):
+        conn = worker_db
+        _enqueue_job(conn, 253)
+        _enqueue_job(conn, 254)
+        conn.execute(
+            "UPDATE text_extraction_queue SET attempts = 2, max_attempts = 2 "
+            "WHERE zoid = 253"
+        )
+        conn.execute(TEXT_EXTRACTION_QUEUE)
+        conn.commit()
+
+        assert _get_queue_status(conn, 253)["status"] == "failed"
+        assert _get_queue_status(conn, 254)["status"] == "pending"
+
+    @patch("plone.pgcatalog.tika_worker.httpx.Client")
+    def test_process_one_passthrough_text_plain(
+        self, mock_client_cls, worker_db, make_worker
+    ):
+        conn = worker_db
+        zoid, tid = 260, 1
+        _insert_object_with_blob(
+            conn,
+            zoid,
+            tid,
+            blob_data=b"Notes about quantum computing",
+            idx={"Language": "en"},
+        )
+        _enqueue_job(conn, zoid, tid, content_type="text/plain; charset=utf-8")
+
+        mock_client = _make_tika_mock(mock_client_cls)
+
+        worker = make_worker(dsn=DSN, tika_url="http://tika:9998")
+        assert worker._process_one() is True
+
+        mock_client.put.assert_not_called()
+        assert _get_queue_status(conn, zoid)["status"] == "done"
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT searchable_text::text FROM object_state WHERE zoid = %(zoid)s",
+                {"zoid": zoid},
+            )
+            assert "quantum" in cur.fetchone()["searchable_text"]
+
+    def test_process_one_empty_queue(self, worker_db, make_worker):
+        worker = make_worker(dsn=DSN, tika_url="http://tika:9998")
         result = worker._process_one()
         assert result is False
 
+    def test_idle_poll_is_one_query(self, worker_db, make_worker):
+        executed = []
+        real_execute = psycopg.Cursor.execute
+
+        def execute(cur, query, *args, **kwargs):
+            executed.append(str(query))
+            return real_execute(cur, query, *args, **kwargs)
+
+        worker = make_worker(dsn=DSN, tika_url="http://tika:9998")
+        worker._get_pool()  # keep the pool's connection check out of the count
+        with patch.object(psycopg.Cursor, "execute", execute):
+            assert worker._process_batch() == 0
+        worker.close()
+
+        # All size tiers are probed by the one claim statement
+        assert len(executed) == 1
+
 
 class TestWorkerSearchableText:
     """Test that extracted text actually merges into searchable_text."""
 
     @patch("plone.pgcatalog.tika_worker.httpx.Client")
-    def test_searchable_text_updated(self, mock_client_cls, worker_db):
+    def test_searchable_text_updated(self, mock_client_cls, worker_db, make_worker):
         conn = worker_db
         zoid, tid = 30, 1
         _insert_object_with_blob(
@@ -219,16 +835,9 @@ class TestWorkerSearchableText:
         conn.commit()
 
         # Mock Tika response
-        mock_response = MagicMock()
-        mock_response.text = "important findings about quantum computing"
-        mock_response.raise_for_status = MagicMock()
-        mock_client = MagicMock()
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
-        mock_client.put.return_value = mock_response
-        mock_client_cls.return_value = mock_client
-
-        worker = TikaWorker(dsn=DSN, tika_url="http://tika:9998")
+        _make_tika_mock(mock_client_cls, "important findings about quantum computing")
+
+        worker = make_worker(dsn=DSN, tika_url="http://tika:9998")
         worker._process_one()
 
         # Verify searchable_text now contains the extracted terms
@@ -243,38 +852,111 @@ class TestWorkerSearchableText:
         assert "comput" in tsv_text or "quantum" in tsv_text  # stemmed
 
 
+class _RecordingCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.conn.last_sql = sql
+        self.conn.last_params = params
+
+    def fetchall(self):
+        return []
+
+
+class _RecordingConn:
+    """Captures the worker's claim statement instead of running it."""
+
+    last_sql = None
+    last_params = None
+
+    def cursor(self, **kw):
+        return _RecordingCursor(self)
+
+    def rollback(self):
+        pass
+
+
+class TestQueueIndexes:
+    """The dequeue stays on the pending partial index as history grows."""
+
+    def test_claim_uses_pending_index(self, worker_db, make_worker):
+        conn = worker_db
+        conn.execute(
+            "INSERT INTO text_extraction_queue "
+            "(zoid, blob_zoid, tid, content_type, status) "
+            "SELECT n, n, 1, 'application/pdf', 'done' "
+            "FROM generate_series(1, 10000) AS n"
+        )
+        conn.execute(
+            "INSERT INTO text_extraction_queue "
+            "(zoid, blob_zoid, tid, content_type) "
+            "SELECT n, n, 1, 'application/pdf' "
+            "FROM generate_series(10001, 10010) AS n"
+        )
+        conn.commit()
+        conn.execute("ANALYZE text_extraction_queue")
+
+        recorder = _RecordingConn()
+        worker = make_worker(dsn=DSN, tika_url="http://tika:9998")
+        worker._claim_jobs(recorder, 10)
+
+        rows = conn.execute(
+            "EXPLAIN " + recorder.last_sql, recorder.last_params
+        ).fetchall()
+        conn.rollback()
+        plan = "\n".join(row["QUERY PLAN"] for row in rows)
+        assert "idx_teq_pending" in plan
+        assert "Seq Scan on text_extraction_queue" not in plan
+
+
 class TestWorkerConcurrency:
     """Test SKIP LOCKED concurrent dequeue safety."""
 
     @patch("plone.pgcatalog.tika_worker.httpx.Client")
-    def test_skip_locked_no_double_processing(self, mock_client_cls, worker_db):
-        """Two workers should not process the same job."""
+    def test_skip_locked_no_double_processing(
+        self, mock_client_cls, worker_db, make_worker
+    ):
+        """Two workers should claim disjoint batches."""
         conn = worker_db
 
         # Create multiple jobs
-        for i in range(1, 4):
-            _insert_object_with_blob(conn, zoid=100 + i, tid=1)
-            _enqueue_job(conn, zoid=100 + i, tid=1)
+        _bulk_insert_objects_with_blobs(
+            conn, [(zoid, b"fake pdf") for zoid in (101, 102, 103)], enqueue=True
+        )
 
         # Mock Tika
-        mock_response = MagicMock()
-        mock_response.text = "extracted"
-        mock_response.raise_for_status = MagicMock()
-        mock_client = MagicMock()
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
-        mock_client.put.return_value = mock_response
-        mock_client_cls.return_value = mock_client
-
-        # Run two workers, each processing one job
-        worker1 = TikaWorker(dsn=DSN, tika_url="http://tika:9998")
-        worker2 = TikaWorker(dsn=DSN, tika_url="http://tika:9998")
+        _make_tika_mock(mock_client_cls)
+
+        # Run two workers, each claiming a batch of up to two jobs
+        worker1 = make_worker(dsn=DSN, tika_url="http://tika:9998", batch_size=2)
+        worker2 = make_worker(dsn=DSN, tika_url="http://tika:9998", batch_size=2)
+
+        claimed = {}
+
+        def record_claims(w, name):
+            claim_jobs = w._claim_jobs
+
+            def wrapper(conn, limit):
+                jobs = claim_jobs(conn, limit)
+                claimed[name] = {job["zoid"] for job in jobs}
+                return jobs
+
+            w._claim_jobs = wrapper
+
+        record_claims(worker1, "w1")
+        record_claims(worker2, "w2")
 
         processed = []
 
         def run_worker(w):
-            if w._process_one():
-                processed.append(True)
+            processed.append(w._process_batch())
 
         t1 = threading.Thread(target=run_worker, args=(worker1,))
         t2 = threading.Thread(target=run_worker, args=(worker2,))
@@ -283,27 +965,197 @@ class TestWorkerConcurrency:
         t1.join(timeout=10)
         t2.join(timeout=10)
 
-        # Both should have processed a job (different ones via SKIP LOCKED)
-        assert len(processed) == 2
-
-        # All 3 jobs should be processed after one more round
-        worker1._process_one()
+        # Together they drained the queue, each job exactly once
+        assert sorted(processed) == [1, 2]
+        assert claimed["w1"].isdisjoint(claimed["w2"])
+        assert claimed["w1"] | claimed["w2"] == {101, 102, 103}
         with conn.cursor() as cur:
             cur.execute(
                 "SELECT COUNT(*) FROM text_extraction_queue WHERE status = 'done'"
             )
             assert cur.fetchone()["count"] == 3
 
+    @patch("plone.pgcatalog.tika_worker.httpx.Client")
+    def test_skip_locked_scales_to_100_jobs(
+        self, mock_client_cls, worker_db, make_worker
+    ):
+        """Several batched workers drain a deep queue, each job once."""
+        conn = worker_db
+        zoids = range(1000, 1100)
+        _bulk_copy_objects_with_blobs(conn, [(zoid, b"fake pdf") for zoid in zoids])
+        _bulk_copy_queue(conn, [(zoid, 1, "application/pdf") for zoid in zoids])
+
+        _make_tika_mock(mock_client_cls)
+
+        workers = [
+            make_worker(dsn=DSN, tika_url="http://tika:9998", batch_size=10)
+            for _ in range(4)
+        ]
+        claimed = []
+        lock = threading.Lock()
+
+        def record_claims(w):
+            claim_jobs = w._claim_jobs
+
+            def wrapper(conn, limit):
+                jobs = claim_jobs(conn, limit)
+                with lock:
+                    claimed.extend(job["zoid"] for job in jobs)
+                return jobs
+
+            w._claim_jobs = wrapper
+
+        def drain(w):
+            while w._process_batch():
+                pass
+            w.close()
+
+        for w in workers:
+            record_claims(w)
+        threads = [threading.Thread(target=drain, args=(w,)) for w in workers]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=60)
+
+        assert len(claimed) == 100
+        assert set(claimed) == set(zoids)
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT COUNT(*) FROM text_extraction_queue WHERE status = 'done'"
+            )
+            assert cur.fetchone()["count"] == 100
+
+
+class TestDecodeText:
+    """Local decoding of passthrough content types."""
+
+    def test_bytes_default_utf8(self):
+        assert _decode_text("Grüße".encode(), "") == "Grüße"
+
+    def test_charset_param(self):
+        assert _decode_text("Grüße".encode("latin-1"), " charset=ISO-8859-1") == (
+            "Grüße"
+        )
+
+    def test_unknown_charset_falls_back(self):
+        assert _decode_text(b"plain", " charset=no-such-codec") == "plain"
+
+    @pytest.mark.parametrize("charset", ["base64", "base64_codec", "rot13", "zlib"])
+    def test_non_text_codec_falls_back(self, charset):
+        assert _decode_text(b"plain\xff", f" charset={charset}") == "plain\ufffd"
+
+    def test_chunks_split_inside_character(self):
+        data = "Grüße".encode()
+        chunks = iter([data[:3], data[3:]])  # splits the two-byte "ü"
+        assert _decode_text(chunks, "") == "Grüße"
+
+    def test_undecodable_bytes_replaced(self):
+        assert _decode_text(b"ok\xff", "") == "ok\ufffd"
+
+
+class TestWorkerClient:
+    """The shared Tika HTTP client."""
+
+    @patch("plone.pgcatalog.tika_worker.httpx.Client")
+    def test_concurrent_first_use_creates_one_client(
+        self, mock_client_cls, make_worker
+    ):
+        worker = make_worker(dsn=DSN, tika_url="http://tika:9998")
+        barrier = threading.Barrier(4)
+        clients = []
+
+        def make_client(**kwargs):
+            time.sleep(0.05)  # widen the race window
+            return MagicMock()
+
+        mock_client_cls.side_effect = make_client
+
+        def get_client():
+            barrier.wait()
+            clients.append(worker._get_client())
+
+        threads = [threading.Thread(target=get_client) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=10)
+
+        mock_client_cls.assert_called_once()
+        assert len(clients) == 4
+        assert all(client is clients[0] for client in clients)
+
+    def test_concurrent_first_use_creates_one_s3_client(self, make_worker):
+        worker = make_worker(
+            dsn=DSN, tika_url="http://tika:9998", s3_config={"bucket_name": "b"}
+        )
+        barrier = threading.Barrier(4)
+        clients = []
+
+        def make_client(*args, **kwargs):
+            time.sleep(0.05)  # widen the race window
+            return MagicMock()
+
+        boto3 = MagicMock()
+        boto3.client.side_effect = make_client
+
+        def get_client():
+            barrier.wait()
+            clients.append(worker._get_s3_client())
+
+        with patch.dict("sys.modules", {"boto3": boto3}):
+            threads = [threading.Thread(target=get_client) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join(timeout=10)
+
+        boto3.client.assert_called_once()
+        assert len(clients) == 4
+        assert all(client is clients[0] for client in clients)
+
+    @patch("plone.pgcatalog.tika_worker.httpx.Client")
+    def test_http1_by_default(self, mock_client_cls, make_worker):
+        worker = make_worker(dsn=DSN, tika_url="https://tika:9998")
+        worker._get_client()
+        assert mock_client_cls.call_args.kwargs["http2"] is False
+
+    @patch("plone.pgcatalog.tika_worker.httpx.Client")
+    def test_http2_enabled(self, mock_client_cls, make_worker):
+        pytest.importorskip("h2")
+        worker = make_worker(dsn=DSN, tika_url="https://tika:9998", http2=True)
+        worker._get_client()
+        assert mock_client_cls.call_args.kwargs["http2"] is True
+
+    @patch("plone.pgcatalog.tika_worker.httpx.Client")
+    def test_http2_without_h2_falls_back(self, mock_client_cls, make_worker):
+        worker = make_worker(dsn=DSN, tika_url="https://tika:9998", http2=True)
+        with patch.dict("sys.modules", {"h2": None}):
+            worker._get_client()
+        assert mock_client_cls.call_args.kwargs["http2"] is False
+
 
 class TestWorkerShutdown:
     """Test graceful shutdown."""
 
-    def test_shutdown_flag(self):
-        worker = TikaWorker(dsn=DSN, tika_url="http://tika:9998")
+    def test_shutdown_flag(self, make_worker):
+        worker = make_worker(dsn=DSN, tika_url="http://tika:9998")
         assert not worker._shutdown.is_set()
         worker.shutdown()
         assert worker._shutdown.is_set()
 
+    def test_run_closes_on_error(self, make_worker):
+        worker = make_worker(dsn=DSN, tika_url="http://tika:9998")
+        client = MagicMock()
+        worker._client = client
+        with (
+            patch.object(worker, "_listen_loop", side_effect=RuntimeError("boom")),
+            pytest.raises(RuntimeError),
+        ):
+            worker.run()
+        client.close.assert_called_once_with()
+        assert worker._client is None
+
 
 # ── Integration tests (require real Tika server) ─────────────────────
 
@@ -315,19 +1167,25 @@ class TestWorkerIntegration:
 
     pytestmark = pytest.mark.skipif(not TIKA_URL, reason="PGCATALOG_TIKA_URL not set")
 
-    def test_extract_plain_text(self, worker_db):
-        """Worker extracts text from a plain text blob via real Tika."""
+    def test_extract_rtf_content(self, worker_db, make_worker):
+        """Worker extracts text from an RTF blob via real Tika.
+
+        (Plain text skips Tika; see test_process_one_passthrough_text_plain.)
+        """
         conn = worker_db
         zoid, tid = 50, 1
-        text_content = b"Important findings about quantum computing research"
+        rtf_blob = (
+            b"{\\rtf1\\ansi{\\fonttbl\\f0\\fswiss Helvetica;}\\f0\\pard "
+            b"Important findings about quantum computing research\\par}"
+        )
         _insert_object_with_blob(
             conn,
             zoid,
             tid,
-            blob_data=text_content,
+            blob_data=rtf_blob,
             idx={"Language": "en", "Title": "Research"},
         )
-        _enqueue_job(conn, zoid, tid, content_type="text/plain")
+        _enqueue_job(conn, zoid, tid, content_type="application/rtf")
 
         # Set initial searchable_text
         conn.execute(
@@ -338,7 +1196,7 @@ class TestWorkerIntegration:
         )
         conn.commit()
 
-        worker = TikaWorker(dsn=DSN, tika_url=TIKA_URL)
+        worker = make_worker(dsn=DSN, tika_url=TIKA_URL)
         result = worker._process_one()
         assert result is True
 
@@ -357,7 +1215,7 @@ class TestWorkerIntegration:
         tsv_text = row["searchable_text"]
         assert "quantum" in tsv_text or "comput" in tsv_text
 
-    def test_extract_html_content(self, worker_db):
+    def test_extract_html_content(self, worker_db, make_worker):
         """Worker extracts text from HTML via real Tika."""
         conn = worker_db
         zoid, tid = 60, 1
@@ -373,7 +1231,7 @@ class TestWorkerIntegration:
         )
         conn.commit()
 
-        worker = TikaWorker(dsn=DSN, tika_url=TIKA_URL)
+        worker = make_worker(dsn=DSN, tika_url=TIKA_URL)
         worker._process_one()
 
         status = _get_queue_status(conn, zoid)
@@ -8,17 +8,56 @@ from plone.pgcatalog.backends import BM25Backend
 from plone.pgcatalog.backends import TsvectorBackend
 from plone.pgcatalog.columns import IndexRegistry
 from plone.pgcatalog.columns import IndexType
+from tests.conftest import DSN
 from unittest import mock
 
 import pytest
 
 
-@pytest.fixture()
-def _mock_registry():
-    """Populate the module-level IndexRegistry with test data."""
-    from plone.pgcatalog import columns
+class FakeCursor:
+    """Minimal stand-in for a psycopg dict-row cursor.
 
-    old = columns._registry
+    Returns the given rows and records the last executed statement.
+    """
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.last_sql = None
+        self.last_params = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def execute(self, sql, params=None):
+        self.last_sql = sql
+        self.last_params = params
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    def fetchall(self):
+        return list(self.rows)
+
+
+class FakeConn:
+    """Connection whose ``cursor()`` always hands out the same FakeCursor."""
+
+    def __init__(self, rows):
+        self._cursor = FakeCursor(rows)
+
+    def cursor(self):
+        return self._cursor
+
+
+@pytest.fixture(scope="module")
+def _module_registry():
+    """IndexRegistry with test data, built once per module.
+
+    The ZMI helpers only read the registry, so all tests can share it.
+    """
     reg = IndexRegistry()
     reg.register("Title", IndexType.TEXT, "Title", ["Title"])
     reg.register("portal_type", IndexType.FIELD, "portal_type", ["portal_type"])
@@ -28,8 +67,17 @@ def _mock_registry():
     reg.add_metadata("Title")
     reg.add_metadata("Description")
     reg.add_metadata("portal_type")
-    columns._registry = reg
-    yield reg
+    return reg
+
+
+@pytest.fixture()
+def _mock_registry(_module_registry):
+    """Install the shared test IndexRegistry as the module-level one."""
+    from plone.pgcatalog import columns
+
+    old = columns._registry
+    columns._registry = _module_registry
+    yield _module_registry
     columns._registry = old
 
 
@@ -108,11 +156,10 @@ class TestManageGetCatalogSummary:
     """Tests for manage_get_catalog_summary()."""
 
     def test_tsvector_backend(self, catalog_tool, _mock_registry):
-        mock_conn = mock.MagicMock()
-        mock_conn.cursor().__enter__().fetchone.return_value = {"cnt": 42}
+        conn = FakeConn([{"cnt": 42}])
         with (
             mock.patch.object(
-                catalog_tool, "_get_pg_read_connection", return_value=mock_conn
+                catalog_tool, "_get_pg_read_connection", return_value=conn
             ),
             mock.patch(
                 "plone.pgcatalog.catalog.get_backend", return_value=TsvectorBackend()
@@ -127,13 +174,12 @@ class TestManageGetCatalogSummary:
         assert result["metadata_count"] == 3
 
     def test_bm25_backend(self, catalog_tool, _mock_registry):
-        mock_conn = mock.MagicMock()
-        mock_conn.cursor().__enter__().fetchone.return_value = {"cnt": 100}
+        conn = FakeConn([{"cnt": 100}])
         bm25 = BM25Backend.__new__(BM25Backend)
         bm25.languages = ["en", "de"]
         with (
             mock.patch.object(
-                catalog_tool, "_get_pg_read_connection", return_value=mock_conn
+                catalog_tool, "_get_pg_read_connection", return_value=conn
             ),
             mock.patch("plone.pgcatalog.catalog.get_backend", return_value=bm25),
         ):
@@ -143,11 +189,10 @@ class TestManageGetCatalogSummary:
         assert result["bm25_languages"] == ["en", "de"]
 
     def test_empty_db(self, catalog_tool, _mock_registry):
-        mock_conn = mock.MagicMock()
-        mock_conn.cursor().__enter__().fetchone.return_value = {"cnt": 0}
+        conn = FakeConn([{"cnt": 0}])
         with (
             mock.patch.object(
-                catalog_tool, "_get_pg_read_connection", return_value=mock_conn
+                catalog_tool, "_get_pg_read_connection", return_value=conn
             ),
             mock.patch(
                 "plone.pgcatalog.catalog.get_backend", return_value=TsvectorBackend()
@@ -165,10 +210,9 @@ class TestManageGetCatalogObjects:
             {"zoid": 1, "path": "/Plone", "portal_type": "Plone Site", "_total": 100},
             {"zoid": 2, "path": "/Plone/doc", "portal_type": "Document", "_total": 100},
         ]
-        mock_conn = mock.MagicMock()
-        mock_conn.cursor().__enter__().fetchall.return_value = rows
+        conn = FakeConn(rows)
         with mock.patch.object(
-            catalog_tool, "_get_pg_read_connection", return_value=mock_conn
+            catalog_tool, "_get_pg_read_connection", return_value=conn
         ):
             result = catalog_tool.manage_get_catalog_objects()
         assert result["total"] == 100
@@ -177,10 +221,9 @@ class TestManageGetCatalogObjects:
         assert result["objects"][1]["portal_type"] == "Document"
 
     def test_empty_result(self, catalog_tool):
-        mock_conn = mock.MagicMock()
-        mock_conn.cursor().__enter__().fetchall.return_value = []
+        conn = FakeConn([])
         with mock.patch.object(
-            catalog_tool, "_get_pg_read_connection", return_value=mock_conn
+            catalog_tool, "_get_pg_read_connection", return_value=conn
         ):
             result = catalog_tool.manage_get_catalog_objects()
         assert result["total"] == 0
@@ -188,69 +231,133 @@ class TestManageGetCatalogObjects:
 
     def test_null_portal_type_becomes_empty_string(self, catalog_tool):
         rows = [{"zoid": 1, "path": "/x", "portal_type": None, "_total": 1}]
-        mock_conn = mock.MagicMock()
-        mock_conn.cursor().__enter__().fetchall.return_value = rows
+        conn = FakeConn(rows)
         with mock.patch.object(
-            catalog_tool, "_get_pg_read_connection", return_value=mock_conn
+            catalog_tool, "_get_pg_read_connection", return_value=conn
         ):
             result = catalog_tool.manage_get_catalog_objects()
         assert result["objects"][0]["portal_type"] == ""
 
     def test_filterpath_escapes_wildcards(self, catalog_tool):
-        mock_conn = mock.MagicMock()
-        mock_conn.cursor().__enter__().fetchall.return_value = []
+        conn = FakeConn([])
         with mock.patch.object(
-            catalog_tool, "_get_pg_read_connection", return_value=mock_conn
+            catalog_tool, "_get_pg_read_connection", return_value=conn
         ):
             catalog_tool.manage_get_catalog_objects(filterpath="/Plone/100%_done")
         # Verify the LIKE parameter was escaped
-        call_args = mock_conn.cursor().__enter__().execute.call_args
-        params = call_args[0][1]
+        params = conn.cursor().last_params
         assert params["prefix"] == "/Plone/100\\%\\_done%"
 
+    @pytest.mark.skipif(not DSN, reason="No PostgreSQL DSN configured")
+    def test_filterpath_uses_path_index(self, catalog_tool, pg_conn_with_catalog):
+        conn = FakeConn([])
+        with mock.patch.object(
+            catalog_tool, "_get_pg_read_connection", return_value=conn
+        ):
+            catalog_tool.manage_get_catalog_objects(filterpath="/Plone/100%_done")
+        cur = conn.cursor()
+
+        pg_conn = pg_conn_with_catalog
+        pg_conn.execute("SET LOCAL enable_seqscan = off")
+        row = pg_conn.execute(
+            "EXPLAIN (FORMAT JSON) " + cur.last_sql, cur.last_params
+        ).fetchone()
+        pg_conn.rollback()
+
+        # Which path index serves the prefix is up to the planner; it
+        # only has to be an index condition, not a scan of object_state.
+        nodes, stack = [], [row["QUERY PLAN"][0]["Plan"]]
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            stack.extend(node.get("Plans", ()))
+        assert not any(
+            n["Node Type"] == "Seq Scan" and n.get("Relation Name") == "object_state"
+            for n in nodes
+        )
+        assert any("path" in n.get("Index Cond", "") for n in nodes)
+
     def test_batch_start_passed_as_offset(self, catalog_tool):
-        mock_conn = mock.MagicMock()
-        mock_conn.cursor().__enter__().fetchall.return_value = []
+        conn = FakeConn([])
         with mock.patch.object(
-            catalog_tool, "_get_pg_read_connection", return_value=mock_conn
+            catalog_tool, "_get_pg_read_connection", return_value=conn
         ):
             catalog_tool.manage_get_catalog_objects(batch_start=40)
-        call_args = mock_conn.cursor().__enter__().execute.call_args
-        params = call_args[0][1]
+        params = conn.cursor().last_params
         assert params["offset"] == 40
 
 
 class TestManageGetObjectDetail:
     """Tests for manage_get_object_detail()."""
 
-    def test_returns_sorted_idx_items(self, catalog_tool):
+    def test_returns_idx_items_in_query_order(self, catalog_tool):
         row = {
             "path": "/Plone/doc",
-            "idx": {"Title": "Hello", "portal_type": "Document", "UID": "abc-123"},
+            # Sorted by PG (jsonb_each ... ORDER BY k COLLATE "C")
+            "idx_items": [
+                {"key": "Title", "value": "Hello"},
+                {"key": "UID", "value": "abc-123"},
+                {"key": "portal_type", "value": "Document"},
+            ],
             "has_searchable_text": True,
             "searchable_text_preview": "'hello':1",
         }
-        mock_conn = mock.MagicMock()
-        mock_conn.cursor().__enter__().fetchone.return_value = row
+        conn = FakeConn([row])
         with mock.patch.object(
-            catalog_tool, "_get_pg_read_connection", return_value=mock_conn
+            catalog_tool, "_get_pg_read_connection", return_value=conn
         ):
             result = catalog_tool.manage_get_object_detail(zoid=42)
         assert result["path"] == "/Plone/doc"
         keys = [item["key"] for item in result["idx_items"]]
         assert keys == ["Title", "UID", "portal_type"]
 
+    @pytest.mark.skipif(not DSN, reason="No PostgreSQL DSN configured")
+    def test_idx_items_sorted_by_pg(self, catalog_tool, pg_conn_with_catalog):
+        from psycopg.types.json import Json
+        from tests.conftest import insert_object
+
+        pg_conn = pg_conn_with_catalog
+        insert_object(pg_conn, 42)
+        pg_conn.execute(
+            "UPDATE object_state SET path = '/Plone/doc', idx = %(idx)s "
+            "WHERE zoid = 42",
+            {
+                "idx": Json(
+                    {
+                        "portal_type": "Document",
+                        "UID": "abc-123",
+                        "Title": "Hello",
+                        "Subject": ["a", "b"],
+                        "expires": None,
+                    }
+                )
+            },
+        )
+        pg_conn.commit()
+        with mock.patch.object(
+            catalog_tool, "_get_pg_read_connection", return_value=pg_conn
+        ):
+            result = catalog_tool.manage_get_object_detail(zoid=42)
+        assert [item["key"] for item in result["idx_items"]] == [
+            "Subject",
+            "Title",
+            "UID",
+            "expires",
+            "portal_type",
+        ]
+        assert result["idx_items"][0]["value"] == "a, b"
+        assert result["idx_items"][3]["is_none"] is True
+
     def test_none_value_marked(self, catalog_tool):
         row = {
             "path": "/x",
-            "idx": {"review_state": None},
+            "idx_items": [{"key": "review_state", "value": None}],
             "has_searchable_text": False,
             "searchable_text_preview": None,
         }
-        mock_conn = mock.MagicMock()
-        mock_conn.cursor().__enter__().fetchone.return_value = row
+        conn = FakeConn([row])
         with mock.patch.object(
-            catalog_tool, "_get_pg_read_connection", return_value=mock_conn
+            catalog_tool, "_get_pg_read_connection", return_value=conn
         ):
             result = catalog_tool.manage_get_object_detail(zoid=1)
         item = result["idx_items"][0]
@@ -260,14 +367,13 @@ class TestManageGetObjectDetail:
     def test_list_value_joined(self, catalog_tool):
         row = {
             "path": "/x",
-            "idx": {"Subject": ["python", "zope"]},
+            "idx_items": [{"key": "Subject", "value": ["python", "zope"]}],
             "has_searchable_text": False,
             "searchable_text_preview": None,
         }
-        mock_conn = mock.MagicMock()
-        mock_conn.cursor().__enter__().fetchone.return_value = row
+        conn = FakeConn([row])
         with mock.patch.object(
-            catalog_tool, "_get_pg_read_connection", return_value=mock_conn
+            catalog_tool, "_get_pg_read_connection", return_value=conn
         ):
             result = catalog_tool.manage_get_object_detail(zoid=1)
         item = result["idx_items"][0]
@@ -277,14 +383,13 @@ class TestManageGetObjectDetail:
         # Test True value displays as "true"
         row = {
             "path": "/x",
-            "idx": {"is_folderish": True},
+            "idx_items": [{"key": "is_folderish", "value": True}],
             "has_searchable_text": False,
             "searchable_text_preview": None,
         }
-        mock_conn = mock.MagicMock()
-        mock_conn.cursor().__enter__().fetchone.return_value = row
+        conn = FakeConn([row])
         with mock.patch.object(
-            catalog_tool, "_get_pg_read_connection", return_value=mock_conn
+            catalog_tool, "_get_pg_read_connection", return_value=conn
         ):
             result = catalog_tool.manage_get_object_detail(zoid=1)
         assert result["idx_items"][0]["value"] == "true"
@@ -293,23 +398,21 @@ class TestManageGetObjectDetail:
         # Test False value displays as "false"
         row = {
             "path": "/x",
-            "idx": {"is_folderish": False},
+            "idx_items": [{"key": "is_folderish", "value": False}],
             "has_searchable_text": False,
             "searchable_text_preview": None,
         }
-        mock_conn = mock.MagicMock()
-        mock_conn.cursor().__enter__().fetchone.return_value = row
+        conn = FakeConn([row])
         with mock.patch.object(
-            catalog_tool, "_get_pg_read_connection", return_value=mock_conn
+            catalog_tool, "_get_pg_read_connection", return_value=conn
         ):
             result = catalog_tool.manage_get_object_detail(zoid=1)
         assert result["idx_items"][0]["value"] == "false"
 
     def test_not_found_returns_none(self, catalog_tool):
-        mock_conn = mock.MagicMock()
-        mock_conn.cursor().__enter__().fetchone.return_value = None
+        conn = FakeConn([])
         with mock.patch.object(
-            catalog_tool, "_get_pg_read_connection", return_value=mock_conn
+            catalog_tool, "_get_pg_read_connection", return_value=conn
         ):
             result = catalog_tool.manage_get_object_detail(zoid=999)
         assert result is None
@@ -317,14 +420,13 @@ class TestManageGetObjectDetail:
     def test_empty_idx_returns_empty_items(self, catalog_tool):
         row = {
             "path": "/x",
-            "idx": None,
+            "idx_items": [],
             "has_searchable_text": False,
             "searchable_text_preview": None,
         }
-        mock_conn = mock.MagicMock()
-        mock_conn.cursor().__enter__().fetchone.return_value = row
+        conn = FakeConn([row])
         with mock.patch.object(
-            catalog_tool, "_get_pg_read_connection", return_value=mock_conn
+            catalog_tool, "_get_pg_read_connection", return_value=conn
         ):
             result = catalog_tool.manage_get_object_detail(zoid=1)
         assert result["idx_items"] == []